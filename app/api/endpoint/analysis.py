@@ -1,5 +1,5 @@
 from typing import Annotated
-from fastapi import APIRouter, Body, Depends, Request
+from fastapi import APIRouter, Body, Depends, Request, Response
 from fastapi.responses import StreamingResponse
 
 from app.common.enums import TaskStatus
@@ -110,4 +110,10 @@ async def retrieve_overview_analysis(
     usecase: RetrieveOverviewAnalysisUsecase = Depends(get_retrieve_overview_analysis_usecase),
     payload: Payload = Depends(get_current_user),
 ):
-    return await usecase.execute(dto, payload)
+    response = await usecase.execute(dto, payload)
+
+    # 응답 모델은 이미 검증되었으므로 FastAPI의 재검증 및 jsonable_encoder 변환 없이 바로 직렬화
+    return Response(
+        content=response.model_dump_json(by_alias=True, exclude_none=True),
+        media_type="application/json",
+    )
@@ -1,4 +1,5 @@
 # RepositoryError
+from typing import Optional
 from fastapi import HTTPException
 
 
@@ -121,6 +122,16 @@ class ExternalAPIError(AnalysisServiceError):  # 외부 API 호출 오류
     pass
 
 
+class NonRetryableExternalAPIError(ExternalAPIError):  # 재시도해도 결과가 같은 외부 API 오류 (인증 실패, 잘못된 요청 등)
+    pass
+
+
+class ExternalAPIRateLimitError(ExternalAPIError):  # 외부 API 요청 한도 초과
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 class JSONValidationError(ValueError, AnalysisServiceError):  # JSON 형식 검증 오류
     pass
 
@@ -0,0 +1,45 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, TypeVar
+
+T = TypeVar('T')
+
+
+class _LeaderCancelled(Exception):
+    pass
+
+
+class SingleFlight(Generic[T]):
+    def __init__(self) -> None:
+        self._inflight: Dict[str, asyncio.Future[T]] = {}
+
+    async def do(
+        self,
+        key: str,
+        function: Callable[[], Awaitable[T]],
+    ) -> T:
+        # 동일한 키의 작업이 진행 중이면 그 결과를 함께 기다림
+        while (future := self._inflight.get(key)) is not None:
+            try:
+                return await asyncio.shield(future)
+            except _LeaderCancelled:
+                continue  # 실행 중이던 요청이 취소되면 대기자 중 하나가 다시 실행
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+
+        try:
+            result = await function()
+        except asyncio.CancelledError:
+            # 공유 future를 취소하면 취소되지 않은 대기자까지 CancelledError를 받으므로 재실행을 알림
+            future.set_exception(_LeaderCancelled())
+            future.exception()
+            raise
+        except BaseException as exception:
+            future.set_exception(exception)
+            future.exception()  # 대기자가 없어도 경고가 남지 않도록 조회 처리
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
@@ -1,19 +1,29 @@
 import asyncio
-import json
 import logging
+import random
 import re
-from typing import Callable, TypeVar, Awaitable
+from typing import Any, Callable, List, Optional, Tuple, Type, TypeVar, Awaitable
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import from_json, to_json
 
-from app.common.exceptions import JSONValidationError
+from app.common.exceptions import ExternalAPIRateLimitError, JSONValidationError, NonRetryableExternalAPIError
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+_JSON_PATTERNS = (
+    re.compile(r"\[[\s\S]*\]"),  # 배열 우선
+    re.compile(r"\{[\s\S]*\}"),
+)
+
 
 async def retry(
     function: Callable[[], Awaitable[T]],
     max_attempts: int,
+    base_delay: float = 0.5,
+    max_delay: float = 10.0,
+    non_retryable_exceptions: Tuple[Type[BaseException], ...] = (),
 ) -> T:
     last_exception = None
 
@@ -22,11 +32,17 @@ async def retry(
             return await function()
 
         except Exception as exception:
+            if isinstance(exception, (NonRetryableExternalAPIError, *non_retryable_exceptions)):
+                raise  # 재시도해도 결과가 같으므로 즉시 전파
+
             logger.warning(f"시도 {attempt + 1}/{max_attempts} 실패: {str(exception)}")
             last_exception = exception
 
             if attempt < max_attempts - 1:
-                wait_time = attempt**2
+                # 동시에 실패한 요청들이 같은 시점에 몰리지 않도록 지수 백오프에 jitter 적용
+                wait_time = min(max_delay, base_delay * 2**attempt) * random.uniform(0.5, 1.5)
+                if isinstance(exception, ExternalAPIRateLimitError) and exception.retry_after is not None:
+                    wait_time = max(wait_time, min(exception.retry_after, max_delay))
                 await asyncio.sleep(wait_time)
                 continue
 
@@ -37,72 +53,162 @@ async def retry(
 def validate_json(
     content: str,
 ) -> str:
+    content = content.strip()
+
+    # Markdown 코드 블록 제거
+    if content.startswith("```json"):
+        content = content.removeprefix("```json").strip()
+    if content.startswith("```"):
+        content = content.removeprefix("```").strip()
+    if content.endswith("```"):
+        content = content.removesuffix("```").strip()
+
+    # 전체 JSON 파싱 시도
+    try:
+        from_json(content)
+        return content
+    except ValueError:
+        pass
+
+    # 파싱에 실패한 경우에만 Trailing comma 제거 후 재시도
+    content = _remove_trailing_commas(content)
+    try:
+        from_json(content)
+        return content
+    except ValueError:
+        pass
+
+    # JSON 부분 추출 시도 (배열 우선)
+    for pattern in _JSON_PATTERNS:
+        match = pattern.search(content)
+        if match:
+            extracted = match.group(0)
+            try:
+                from_json(extracted)
+                return extracted
+            except ValueError:
+                # 배열인 경우 복구 시도
+                if extracted.startswith('['):
+                    # 마지막 쉼표 제거하고 닫기
+                    if extracted.rstrip().endswith(','):
+                        repaired = extracted.rstrip().rstrip(',') + ']'
+                    # 불완전한 객체 제거하고 닫기
+                    elif not extracted.rstrip().endswith(']'):
+                        # 마지막 완전한 } 찾기
+                        brace_count = 0
+                        last_complete = -1
+                        in_string = False
+
+                        for i, char in enumerate(extracted):
+                            if char == '"' and (i == 0 or extracted[i - 1] != '\\'):
+                                in_string = not in_string
+                            elif not in_string:
+                                if char == '{':
+                                    brace_count += 1
+                                elif char == '}':
+                                    brace_count -= 1
+                                    if brace_count == 0:
+                                        last_complete = i
+
+                        repaired = extracted[: last_complete + 1] + ']' if last_complete > 0 else extracted
+                    else:
+                        repaired = extracted
+
+                    try:
+                        from_json(repaired)
+                        return repaired
+                    except ValueError:
+                        continue
+
+    raise JSONValidationError(f"유효한 JSON 구조를 찾을 수 없습니다: {content[:200]}...")
+
+
+def _remove_trailing_commas(
+    content: str,
+) -> str:
+    # 문자열 내부의 ", ]" 등은 유지하도록 따옴표 밖의 쉼표만 제거
+    result: List[str] = []
+    pending_comma = -1
+    in_string = False
+    escaped = False
+
+    for char in content:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+            pending_comma = -1
+        elif char == ',':
+            pending_comma = len(result)
+        elif char in '}]':
+            if pending_comma >= 0:
+                del result[pending_comma]
+                pending_comma = -1
+        elif not char.isspace():
+            pending_comma = -1
+
+        result.append(char)
+
+    return "".join(result)
+
+
+def validate_json_model(
+    adapter: TypeAdapter[T],
+    content: str,
+) -> T:
+    content = content.strip()
+
+    # 정상 응답은 중간 dict 생성 없이 한 번에 파싱/검증
     try:
-        content = content.strip()
+        return adapter.validate_json(content)
+    except ValidationError as exception:
+        if not any(error["type"] == "json_invalid" for error in exception.errors()):
+            raise
 
-        # Markdown 코드 블록 제거
-        if content.startswith("```json"):
-            content = content.removeprefix("```json").strip()
-        if content.startswith("```"):
-            content = content.removeprefix("```").strip()
-        if content.endswith("```"):
-            content = content.removesuffix("```").strip()
+    # 코드 블록, trailing comma 등이 섞인 경우에만 정리 후 재시도
+    return adapter.validate_json(validate_json(content))
 
-        # Trailing comma 제거
-        content = re.sub(r",\s*[}\]]", lambda m: m.group(0)[:-1] + m.group(0)[-1], content)
 
-        # 전체 JSON 파싱 시도
-        try:
-            json.loads(content)
-            return content
-        except json.JSONDecodeError:
-            pass
-
-        # JSON 부분 추출 시도 (배열 우선)
-        for pattern in [r"\[[\s\S]*\]", r"\{[\s\S]*\}"]:
-            match = re.search(pattern, content)
-            if match:
-                extracted = match.group(0)
-                try:
-                    json.loads(extracted)
-                    return extracted
-                except json.JSONDecodeError:
-                    # 배열인 경우 복구 시도
-                    if extracted.startswith('['):
-                        # 마지막 쉼표 제거하고 닫기
-                        if extracted.rstrip().endswith(','):
-                            repaired = extracted.rstrip().rstrip(',') + ']'
-                        # 불완전한 객체 제거하고 닫기
-                        elif not extracted.rstrip().endswith(']'):
-                            # 마지막 완전한 } 찾기
-                            brace_count = 0
-                            last_complete = -1
-                            in_string = False
-
-                            for i, char in enumerate(extracted):
-                                if char == '"' and (i == 0 or extracted[i - 1] != '\\'):
-                                    in_string = not in_string
-                                elif not in_string:
-                                    if char == '{':
-                                        brace_count += 1
-                                    elif char == '}':
-                                        brace_count -= 1
-                                        if brace_count == 0:
-                                            last_complete = i
-
-                            repaired = extracted[: last_complete + 1] + ']' if last_complete > 0 else extracted
-                        else:
-                            repaired = extracted
-
-                        try:
-                            json.loads(repaired)
-                            return repaired
-                        except json.JSONDecodeError:
-                            continue
-
-        raise JSONValidationError(f"유효한 JSON 구조를 찾을 수 없습니다: {content[:200]}...")
-
-    except JSONValidationError:
-        raise
-    except Exception as exception:
-        raise JSONValidationError(f"JSON 검증 중 오류: {str(exception)}") from exception
+async def gather_or_cancel(
+    *awaitables: Awaitable[Any],
+    on_complete: Optional[Callable[[int, int], Awaitable[None]]] = None,
+) -> List[Any]:
+    # 하나라도 실패하면 나머지 작업을 즉시 취소 (asyncio.gather는 나머지가 끝까지 실행됨)
+    try:
+        async with asyncio.TaskGroup() as task_group:
+            tasks = [task_group.create_task(awaitable) for awaitable in awaitables]
+
+            # 완료될 때마다 (완료 수, 전체 수)로 콜백 호출 (콜백은 순차 실행되어 호출 순서가 보장됨)
+            if on_complete is not None:
+                for completed, future in enumerate(asyncio.as_completed(tasks), start=1):
+                    await future
+                    await on_complete(completed, len(tasks))
+    except ExceptionGroup as exception_group:
+        # 호출부의 기존 예외 처리가 그대로 동작하도록 첫 번째 오류만 전파
+        raise exception_group.exceptions[0] from None
+
+    return [task.result() for task in tasks]
+
+
+def parse_retry_after(
+    value: Optional[str],
+) -> Optional[float]:
+    # Retry-After 헤더의 초 단위 값만 지원 (HTTP-date 형식은 무시)
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+def to_compact_json(
+    value: object,
+) -> str:
+    # 프롬프트에 삽입할 값을 공백 없는 JSON으로 직렬화 (한글은 이스케이프하지 않음)
+    return to_json(value).decode("utf-8")
@@ -1,4 +1,4 @@
-from redis.asyncio import Redis, from_url
+from redis.asyncio import BlockingConnectionPool, Redis
 
 from app.core.config import setting
 
@@ -9,22 +9,27 @@ _client = None
 async def get_static_redis_session() -> Redis:
     global _client
 
+    # 커넥션 풀을 가진 클라이언트를 프로세스 전체에서 공유 (호출마다 PING 하지 않음)
     if _client is None:
-        _client = await from_url(
+        # 연결 수를 제한하고, 모두 사용 중이면 오류 대신 반납될 때까지 대기
+        connection_pool = BlockingConnectionPool.from_url(
             f"redis://{setting.REDIS_HOST}:{setting.REDIS_PORT}",
             db=0,
             decode_responses=True,
             socket_keepalive=True,
+            health_check_interval=30,  # 오래 쉰 연결만 사용 전에 상태 확인 후 재연결
+            max_connections=setting.REDIS_MAX_CONNECTIONS,
+            timeout=setting.REDIS_POOL_TIMEOUT_SECONDS,
         )
-    try:
-        await _client.ping()
-    except (ConnectionError, TimeoutError):
-        _client = await from_url(
-            f"redis://{setting.REDIS_HOST}:{setting.REDIS_PORT}",
-            db=0,
-            decode_responses=True,
-            socket_keepalive=True,
-        )
-        await _client.ping()
+        _client = Redis.from_pool(connection_pool)
 
     return _client
+
+
+async def close_static_redis_session() -> None:
+    global _client
+
+    # 생성된 적이 있는 경우에만 커넥션 풀을 정리
+    if _client is not None:
+        await _client.aclose()
+        _client = None
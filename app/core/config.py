@@ -13,16 +13,26 @@ class Setting(BaseSettings):
 
     REDIS_HOST: str
     REDIS_PORT: int
+    REDIS_MAX_CONNECTIONS: int = 100
+    REDIS_POOL_TIMEOUT_SECONDS: int = 5
 
     PG_HOST: str
     PG_PORT: int
     PG_USER: str
     PG_PW: str
     PG_DB: str
+    PG_POOL_SIZE: int = 20
+    PG_MAX_OVERFLOW: int = 10
 
     PERPLEXITY_API_KEY: str
     OPENAI_API_KEY: str
 
+    OPENAI_MAX_CONCURRENT_REQUESTS: int = 32
+    PERPLEXITY_MAX_CONCURRENT_REQUESTS: int = 32
+
+    # 한계점/기회/팀 구성 분석을 한 번의 LLM 호출로 통합
+    COMBINED_ANALYSIS: bool = False
+
     model_config = SettingsConfigDict(
         env_file=os.path.join(
             os.path.dirname(__file__),
@@ -43,8 +43,9 @@ def get_engine() -> AsyncEngine:
         echo=False,
         future=True,
         pool_pre_ping=True,
-        pool_recycle=300,
-        max_overflow=10,
+        pool_recycle=1800,
+        pool_size=setting.PG_POOL_SIZE,  # 동시 요청과 분석 작업이 기본값(5)의 연결을 두고 대기하지 않도록 확장
+        max_overflow=setting.PG_MAX_OVERFLOW,
     )
 
 
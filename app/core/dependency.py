@@ -1,11 +1,12 @@
+from functools import lru_cache
 from fastapi import Depends
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from redis.asyncio import Redis, from_url
+from redis.asyncio import Redis
 from typing import AsyncGenerator
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.common.exceptions import InternalServerException, JWTDecodeError, JWTExpiredError, JWTInvalidError, UnauthorizedException
-from app.core.config import setting
+from app.core.cache import get_static_redis_session
 from app.core.database import get_sessionmaker
 from app.repository.market_research import MarketResearchRepository
 from app.repository.market_trend import MarketTrendRepository
@@ -34,17 +35,8 @@ from app.usecase.term.retrieve_terms import RetrieveTermsUsecase
 
 
 async def get_redis_session() -> AsyncGenerator[Redis, None]:
-    client = await from_url(
-        f"redis://{setting.REDIS_HOST}:{setting.REDIS_PORT}",
-        db=0,
-        decode_responses=True,
-        socket_keepalive=True,
-    )
-
-    try:
-        yield client
-    finally:
-        await client.aclose()
+    # 요청마다 클라이언트(커넥션 풀)를 새로 만들지 않고 공유 클라이언트를 사용
+    yield await get_static_redis_session()
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
@@ -82,14 +74,25 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(HTTPBea
 
 
 # Caches
-def get_task_progress_cache(session: Redis = Depends(get_redis_session)):
+# 캐시는 상태 없이 공유 Redis 클라이언트만 감싸므로 클라이언트별로 한 번만 생성
+@lru_cache(maxsize=1)
+def _create_task_progress_cache(session: Redis) -> TaskProgressCache:
     return TaskProgressCache(session)
 
 
-def get_oauth_profile_cache(session: Redis = Depends(get_redis_session)):
+@lru_cache(maxsize=1)
+def _create_oauth_profile_cache(session: Redis) -> OAuthProfileCache:
     return OAuthProfileCache(session)
 
 
+def get_task_progress_cache(session: Redis = Depends(get_redis_session)):
+    return _create_task_progress_cache(session)
+
+
+def get_oauth_profile_cache(session: Redis = Depends(get_redis_session)):
+    return _create_oauth_profile_cache(session)
+
+
 # Repositories
 def get_user_repository(session: AsyncSession = Depends(get_db_session)):
     return UserRepository(session)
@@ -163,10 +166,9 @@ def get_retrieve_oauth_result_usecase(
 def get_oauth_sign_up_usecase(
     user_repository: UserRepository = Depends(get_user_repository),
     term_repository: TermRepository = Depends(get_term_repository),
-    user_agreement_repository: UserAgreementRepository = Depends(get_user_agreement_repository),
     oauth_profile_cache: OAuthProfileCache = Depends(get_oauth_profile_cache),
 ):
-    return OAuthSignUpUsecase(user_repository, term_repository, user_agreement_repository, oauth_profile_cache)
+    return OAuthSignUpUsecase(user_repository, term_repository, oauth_profile_cache)
 
 
 def get_retrieve_terms_usecase(term_repository: TermRepository = Depends(get_term_repository)):
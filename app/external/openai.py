@@ -1,21 +1,80 @@
+import logging
 from functools import lru_cache
-from typing import AsyncIterator
-from openai import AsyncOpenAI
-from openai import APIError, APITimeoutError, RateLimitError, AuthenticationError
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional
 import asyncio
 
 from app.core.config import setting
-from app.common.exceptions import ExternalAPIError
+from app.common.utils import parse_retry_after
+from app.common.exceptions import ExternalAPIError, ExternalAPIRateLimitError, NonRetryableExternalAPIError
+from app.service.cache.llm_response import cache_llm_response
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+    from openai.types import CompletionUsage
+
+logger = logging.getLogger(__name__)
 
 
 @lru_cache(maxsize=1)
-def _create_openai_client() -> AsyncOpenAI:
+def _create_openai_client() -> "AsyncOpenAI":
+    # openai SDK는 import 비용이 커서 첫 요청 시점에 로드
+    from openai import AsyncOpenAI
+
     return AsyncOpenAI(api_key=setting.OPENAI_API_KEY)
 
 
+@lru_cache(maxsize=1)
+def _create_request_semaphore() -> asyncio.Semaphore:
+    # 프로세스 전체의 동시 요청 수를 제한하여 429 재시도를 방지
+    return asyncio.Semaphore(setting.OPENAI_MAX_CONCURRENT_REQUESTS)
+
+
+def _log_usage(
+    model: str,
+    usage: Optional["CompletionUsage"],
+) -> None:
+    # 프롬프트 prefix 캐시 적중 여부를 확인할 수 있도록 cached_tokens를 함께 기록
+    if usage is None:
+        return
+
+    details = usage.prompt_tokens_details
+    cached_tokens = (details.cached_tokens or 0) if details is not None else 0
+    logger.info(
+        "OpenAI 토큰 사용량 (model=%s): prompt=%d, cached=%d (%.0f%%), completion=%d",
+        model,
+        usage.prompt_tokens,
+        cached_tokens,
+        cached_tokens / usage.prompt_tokens * 100 if usage.prompt_tokens else 0.0,
+        usage.completion_tokens,
+    )
+
+
+def _translate_openai_error(
+    exception: Exception,
+) -> ExternalAPIError:
+    # SDK 예외를 재시도 가능 여부에 따라 공통 예외로 변환 (SDK는 이 시점에 이미 로드되어 있음)
+    from openai import APIError, APITimeoutError, RateLimitError, AuthenticationError, BadRequestError, PermissionDeniedError, NotFoundError, UnprocessableEntityError
+
+    if isinstance(exception, (APITimeoutError, asyncio.TimeoutError)):
+        return ExternalAPIError(f"OpenAI API 요청 타임아웃: {str(exception)}")
+    if isinstance(exception, RateLimitError):
+        return ExternalAPIRateLimitError(
+            f"OpenAI API 요청 한도 초과: {str(exception)}",
+            retry_after=parse_retry_after(exception.response.headers.get("retry-after")),
+        )
+    if isinstance(exception, AuthenticationError):
+        return NonRetryableExternalAPIError(f"OpenAI API 인증 실패: {str(exception)}")
+    if isinstance(exception, (BadRequestError, PermissionDeniedError, NotFoundError, UnprocessableEntityError)):
+        return NonRetryableExternalAPIError(f"OpenAI API 요청 오류: {str(exception)}")
+    if isinstance(exception, APIError):
+        return ExternalAPIError(f"OpenAI API 오류: {str(exception)}")
+    return ExternalAPIError(f"OpenAI 클라이언트 예상치 못한 오류: {str(exception)}")
+
+
 class OpenAIClient:
     _MODEL = "gpt-4o-mini"
 
+    @cache_llm_response
     async def fetch(
         self,
         user_prompt: str,
@@ -24,44 +83,43 @@ class OpenAIClient:
         temperature: float,
         max_tokens: int,
         model: str = _MODEL,
+        response_format: Optional[Dict[str, Any]] = None,
     ) -> str:
+        from openai import NOT_GIVEN
+
         try:
             openai_client = _create_openai_client()
 
-            response = await openai_client.chat.completions.create(
-                model=model,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                timeout=timeout_seconds,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": system_prompt,
-                    },
-                    {
-                        "role": "user",
-                        "content": user_prompt,
-                    },
-                ],
-            )
+            async with _create_request_semaphore():
+                response = await openai_client.chat.completions.create(
+                    model=model,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    timeout=timeout_seconds,
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": system_prompt,
+                        },
+                        {
+                            "role": "user",
+                            "content": user_prompt,
+                        },
+                    ],
+                    response_format=response_format if response_format is not None else NOT_GIVEN,
+                )
+
+            _log_usage(model, response.usage)
 
             if not response.choices or not response.choices[0].message.content:
                 raise ExternalAPIError("OpenAI 응답에서 콘텐츠를 찾을 수 없습니다")
 
             return response.choices[0].message.content.strip()
 
-        except (APITimeoutError, asyncio.TimeoutError) as exception:
-            raise ExternalAPIError(f"OpenAI API 요청 타임아웃: {str(exception)}") from exception
-        except RateLimitError as exception:
-            raise ExternalAPIError(f"OpenAI API 요청 한도 초과: {str(exception)}") from exception
-        except AuthenticationError as exception:
-            raise ExternalAPIError(f"OpenAI API 인증 실패: {str(exception)}") from exception
-        except APIError as exception:
-            raise ExternalAPIError(f"OpenAI API 오류: {str(exception)}") from exception
         except ExternalAPIError:
             raise  # 이미 정의된 예외는 그대로 전파
         except Exception as exception:
-            raise ExternalAPIError(f"OpenAI 클라이언트 예상치 못한 오류: {str(exception)}") from exception
+            raise _translate_openai_error(exception) from exception
 
     async def stream(
         self,
@@ -71,43 +129,83 @@ class OpenAIClient:
         temperature: float,
         max_tokens: int,
         model: str = _MODEL,
+        response_format: Optional[Dict[str, Any]] = None,
     ) -> AsyncIterator[str]:
+        from openai import NOT_GIVEN
+
+        try:
+            openai_client = _create_openai_client()
+
+            async with _create_request_semaphore():
+                stream = await openai_client.chat.completions.create(
+                    model=model,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    timeout=timeout_seconds,
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": system_prompt,
+                        },
+                        {
+                            "role": "user",
+                            "content": user_prompt,
+                        },
+                    ],
+                    response_format=response_format if response_format is not None else NOT_GIVEN,
+                    stream=True,
+                    stream_options={"include_usage": True},
+                )
+
+                async for chunk in stream:
+                    # 마지막 청크는 choices 없이 usage만 포함
+                    if not chunk.choices:
+                        _log_usage(model, chunk.usage)
+                        break
+                    if chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+
+        except ExternalAPIError:
+            raise  # 이미 정의된 예외는 그대로 전파
+        except Exception as exception:
+            raise _translate_openai_error(exception) from exception
+
+    async def embed(
+        self,
+        text: str,
+        timeout_seconds: int,
+        model: str,
+        dimensions: int,
+    ) -> List[float]:
         try:
             openai_client = _create_openai_client()
 
-            stream = await openai_client.chat.completions.create(
-                model=model,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                timeout=timeout_seconds,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": system_prompt,
-                    },
-                    {
-                        "role": "user",
-                        "content": user_prompt,
-                    },
-                ],
-                stream=True,
-            )
-
-            async for chunk in stream:
-                if chunk.choices[0].delta.content:
-                    yield chunk.choices[0].delta.content
-                elif chunk.choices[0].finish_reason:
-                    break
-
-        except (APITimeoutError, asyncio.TimeoutError) as exception:
-            raise ExternalAPIError(f"OpenAI API 스트림 타임아웃: {str(exception)}") from exception
-        except RateLimitError as exception:
-            raise ExternalAPIError(f"OpenAI API 요청 한도 초과: {str(exception)}") from exception
-        except AuthenticationError as exception:
-            raise ExternalAPIError(f"OpenAI API 인증 실패: {str(exception)}") from exception
-        except APIError as exception:
-            raise ExternalAPIError(f"OpenAI API 스트림 오류: {str(exception)}") from exception
-        except (IndexError, AttributeError) as exception:
-            raise ExternalAPIError(f"OpenAI 스트림 응답 파싱 오류: {str(exception)}") from exception
+            async with _create_request_semaphore():
+                response = await openai_client.embeddings.create(
+                    model=model,
+                    input=text,
+                    dimensions=dimensions,
+                    timeout=timeout_seconds,
+                )
+
+            if not response.data:
+                raise ExternalAPIError("OpenAI 응답에서 임베딩을 찾을 수 없습니다")
+
+            return response.data[0].embedding
+
+        except ExternalAPIError:
+            raise  # 이미 정의된 예외는 그대로 전파
         except Exception as exception:
-            raise ExternalAPIError(f"OpenAI 스트림 예상치 못한 오류: {str(exception)}") from exception
+            raise _translate_openai_error(exception) from exception
+
+
+@lru_cache(maxsize=1)
+def get_openai_client() -> OpenAIClient:
+    return OpenAIClient()
+
+
+async def close_openai_client() -> None:
+    # 생성된 적이 있는 경우에만 커넥션 풀을 정리
+    if _create_openai_client.cache_info().currsize:
+        await _create_openai_client().close()
+        _create_openai_client.cache_clear()
@@ -1,8 +1,25 @@
+from functools import lru_cache
+from typing import Any, Dict, Optional
 from httpx import AsyncClient, HTTPStatusError, TimeoutException, ConnectError
-import json
+from pydantic_core import from_json
+import asyncio
 
 from app.core.config import setting
-from app.common.exceptions import ExternalAPIError
+from app.common.utils import parse_retry_after
+from app.common.exceptions import ExternalAPIError, ExternalAPIRateLimitError, NonRetryableExternalAPIError
+from app.service.cache.llm_response import cache_llm_response
+
+
+@lru_cache(maxsize=1)
+def _create_http_client() -> AsyncClient:
+    # 요청마다 TCP/TLS 연결을 새로 맺지 않도록 커넥션 풀을 공유
+    return AsyncClient(base_url=PerplexityClient._API_BASE_URL)
+
+
+@lru_cache(maxsize=1)
+def _create_request_semaphore() -> asyncio.Semaphore:
+    # 프로세스 전체의 동시 요청 수를 제한하여 429 재시도를 방지
+    return asyncio.Semaphore(setting.PERPLEXITY_MAX_CONCURRENT_REQUESTS)
 
 
 class PerplexityClient:
@@ -10,6 +27,7 @@ class PerplexityClient:
     _API_BASE_URL = "https://api.perplexity.ai"
     _CHAT_ENDPOINT = "/chat/completions"
 
+    @cache_llm_response
     async def fetch(
         self,
         user_prompt: str,
@@ -18,34 +36,42 @@ class PerplexityClient:
         temperature: float,
         max_tokens: int,
         model: str = _MODEL,
+        response_format: Optional[Dict[str, Any]] = None,
     ) -> str:
         try:
-            async with AsyncClient(timeout=timeout_seconds) as client:
-                response = await client.post(
-                    f"{self._API_BASE_URL}{self._CHAT_ENDPOINT}",
+            http_client = _create_http_client()
+
+            payload: Dict[str, Any] = {
+                "model": model,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+                "messages": [
+                    {
+                        "role": "system",
+                        "content": system_prompt,
+                    },
+                    {
+                        "role": "user",
+                        "content": user_prompt,
+                    },
+                ],
+            }
+            if response_format is not None:
+                payload["response_format"] = response_format
+
+            async with _create_request_semaphore():
+                response = await http_client.post(
+                    self._CHAT_ENDPOINT,
                     headers={
                         "Authorization": f"Bearer {setting.PERPLEXITY_API_KEY}",
                         "Content-Type": "application/json",
                     },
-                    json={
-                        "model": model,
-                        "temperature": temperature,
-                        "max_tokens": max_tokens,
-                        "messages": [
-                            {
-                                "role": "system",
-                                "content": system_prompt,
-                            },
-                            {
-                                "role": "user",
-                                "content": user_prompt,
-                            },
-                        ],
-                    },
+                    json=payload,
+                    timeout=timeout_seconds,
                 )
 
                 response.raise_for_status()
-                response_data = response.json()
+                response_data = from_json(response.content)
 
                 if "choices" not in response_data or not response_data["choices"]:
                     raise ExternalAPIError("Perplexity 응답에서 콘텐츠를 찾을 수 없습니다")
@@ -57,13 +83,19 @@ class PerplexityClient:
         except ConnectError as exception:
             raise ExternalAPIError(f"Perplexity API 연결 실패: {str(exception)}") from exception
         except HTTPStatusError as exception:
-            if exception.response.status_code == 401:
-                raise ExternalAPIError(f"Perplexity API 인증 실패: {str(exception)}") from exception
-            elif exception.response.status_code == 429:
-                raise ExternalAPIError(f"Perplexity API 요청 한도 초과: {str(exception)}") from exception
+            status_code = exception.response.status_code
+            if status_code == 401:
+                raise NonRetryableExternalAPIError(f"Perplexity API 인증 실패: {str(exception)}") from exception
+            elif status_code == 429:
+                raise ExternalAPIRateLimitError(
+                    f"Perplexity API 요청 한도 초과: {str(exception)}",
+                    retry_after=parse_retry_after(exception.response.headers.get("retry-after")),
+                ) from exception
+            elif 400 <= status_code < 500 and status_code != 408:
+                raise NonRetryableExternalAPIError(f"Perplexity API 요청 오류 ({status_code}): {str(exception)}") from exception
             else:
                 raise ExternalAPIError(f"Perplexity API HTTP 오류 ({exception.response.status_code}): {str(exception)}") from exception
-        except json.JSONDecodeError as exception:
+        except ValueError as exception:
             raise ExternalAPIError(f"Perplexity API 응답 파싱 실패: {str(exception)}") from exception
         except (KeyError, IndexError) as exception:
             raise ExternalAPIError(f"Perplexity API 응답 구조 오류: {str(exception)}") from exception
@@ -71,3 +103,15 @@ class PerplexityClient:
             raise  # 이미 정의된 예외는 그대로 전파
         except Exception as exception:
             raise ExternalAPIError(f"Perplexity 클라이언트 예상치 못한 오류: {str(exception)}") from exception
+
+
+@lru_cache(maxsize=1)
+def get_perplexity_client() -> PerplexityClient:
+    return PerplexityClient()
+
+
+async def close_perplexity_client() -> None:
+    # 생성된 적이 있는 경우에만 커넥션 풀을 정리
+    if _create_http_client.cache_info().currsize:
+        await _create_http_client().aclose()
+        _create_http_client.cache_clear()
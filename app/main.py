@@ -4,8 +4,11 @@ from fastapi import FastAPI
 from contextlib import asynccontextmanager
 from starlette.middleware.sessions import SessionMiddleware
 
+from app.core.cache import close_static_redis_session
 from app.core.database import init_database
 from app.core.config import setting
+from app.external.openai import close_openai_client
+from app.external.perplexity import close_perplexity_client
 from app.api.router import router
 
 
@@ -16,6 +19,9 @@ logging.basicConfig(level=logging.INFO, format='%(message)s')
 async def lifespan(app: FastAPI):
     await init_database()
     yield
+    await close_openai_client()
+    await close_perplexity_client()
+    await close_static_redis_session()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -1,4 +1,6 @@
-from typing import List
+import time
+from datetime import timedelta
+from typing import Dict, List, Optional, Tuple
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlmodel import select
 
@@ -7,6 +9,13 @@ from app.common.exceptions import TermRepositoryError
 
 
 class TermRepository:
+    _ACTIVE_TERMS_EXPIRE_DELTA = timedelta(minutes=10)
+    _TERM_EXPIRE_DELTA = timedelta(minutes=10)
+
+    # 약관은 거의 바뀌지 않으므로 프로세스 단위로 캐시 (만료 시각, 약관 목록) / ID -> (만료 시각, 약관)
+    _active_terms_memory: Optional[Tuple[float, List[Term]]] = None
+    _term_memory: Dict[int, Tuple[float, Term]] = {}
+
     def __init__(
         self,
         session: AsyncSession,
@@ -17,25 +26,54 @@ class TermRepository:
         self,
         ids: List[int],
     ) -> List[Term]:
+        # 캐시에 있는 약관은 그대로 사용하고 나머지만 한 번의 IN 쿼리로 조회
+        now = time.monotonic()
+        cached_terms: List[Term] = []
+        missing_ids: List[int] = []
+        for term_id in dict.fromkeys(ids):
+            entry = self._term_memory.get(term_id)
+            if entry is not None and entry[0] > now:
+                cached_terms.append(entry[1])
+            else:
+                missing_ids.append(term_id)
+
+        if not missing_ids:
+            return cached_terms
+
         try:
-            query = select(Term).where(Term.id.in_(ids))  # type: ignore
+            query = select(Term).where(Term.id.in_(missing_ids))  # type: ignore
             result = await self._session.exec(query)
-            return list(result.all())
+            # 세션에 묶인 인스턴스는 롤백/종료 시 만료되므로 세션과 분리된 복사본을 캐시
+            fetched_terms = [Term.model_validate(term) for term in result.all()]
 
         except Exception as exception:
             raise TermRepositoryError("Term 조회 중 오류가 발생했습니다.") from exception
 
+        expire_at = now + self._TERM_EXPIRE_DELTA.total_seconds()
+        for term in fetched_terms:
+            self._term_memory[term.id] = (expire_at, term)  # type: ignore
+
+        return cached_terms + fetched_terms
+
     async def find_active_terms(
         self,
     ) -> List[Term]:
+        cached = TermRepository._active_terms_memory
+        if cached is not None and cached[0] > time.monotonic():
+            return list(cached[1])
+
         try:
             query = select(Term).where(Term.is_active.is_(True))  # type: ignore
             result = await self._session.exec(query)
-            return list(result.all())
+            # 세션에 묶인 인스턴스는 롤백/종료 시 만료되므로 세션과 분리된 복사본을 캐시
+            active_terms = [Term.model_validate(term) for term in result.all()]
 
         except Exception as exception:
             raise TermRepositoryError("활성 Term 조회 중 오류가 발생했습니다.") from exception
 
+        TermRepository._active_terms_memory = (time.monotonic() + self._ACTIVE_TERMS_EXPIRE_DELTA.total_seconds(), active_terms)
+        return list(active_terms)
+
     async def save_batch(
         self,
         terms: List[Term],
@@ -49,6 +87,9 @@ class TermRepository:
             for term in terms:
                 await self._session.refresh(term)
 
+            # 약관이 변경되었으므로 약관 캐시를 비움
+            TermRepository._active_terms_memory = None
+            self._term_memory.clear()
             return terms
 
         except Exception as exception:
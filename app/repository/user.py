@@ -1,8 +1,9 @@
-from typing import Optional
+from typing import Callable, List, Optional
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.domain.user import User
+from app.domain.user_agreement import UserAgreement
 from app.common.exceptions import UserRepositoryError
 
 
@@ -36,3 +37,23 @@ class UserRepository:
 
         except Exception as exception:
             raise UserRepositoryError("사용자 저장 중 오류가 발생했습니다.") from exception
+
+    async def save_with_term_agreements(
+        self,
+        user: User,
+        term_agreements_factory: Callable[[int], List[UserAgreement]],
+    ) -> List[UserAgreement]:
+        try:
+            # 사용자 ID는 INSERT ... RETURNING으로 채워지므로 별도 refresh 없이 약관 동의 내역을 생성
+            self._session.add(user)
+            await self._session.flush()
+
+            # 약관 동의 내역은 한 번의 다중 행 INSERT로 저장
+            term_agreements = term_agreements_factory(user.id)  # type: ignore
+            self._session.add_all(term_agreements)
+            await self._session.flush()
+
+            return term_agreements
+
+        except Exception as exception:
+            raise UserRepositoryError("사용자 및 약관 동의 내역 저장 중 오류가 발생했습니다.") from exception
@@ -0,0 +1,128 @@
+import logging
+from textwrap import dedent
+from typing import List
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+
+from app.common.utils import retry, to_compact_json, validate_json_model
+from app.external.perplexity import get_perplexity_client
+from app.common.exceptions import AnalysisServiceError, ExternalAPIError, JSONValidationError, ModelValidationError
+
+logger = logging.getLogger(__name__)
+
+
+class CombinedAnalysisServiceResponse(BaseModel):
+    limitation: str
+    opportunity: str
+    team_requirement: str = Field(alias="teamRequirement")
+
+
+_RESPONSE_ADAPTER = TypeAdapter(CombinedAnalysisServiceResponse)
+
+# 응답 스키마를 강제하여 형식 오류로 인한 재시도를 줄임
+_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"schema": _RESPONSE_ADAPTER.json_schema(by_alias=True)},
+}
+
+
+# 한계점/기회/팀 구성 분석은 입력(아이디어, 문제, 핵심 기능)이 같으므로 한 번의 호출로 요청
+class CombinedAnalysisService:
+    _TIMEOUT_SECONDS = 60 * 5
+    _TEMPERATURE = 0.7
+    _MAX_TOKENS = 3000  # 분석 1개당 1000
+    _MAX_ATTEMPTS = 3
+
+    _PROMPT_PREFIX = dedent(
+        """
+        다음 비즈니스 아이디어에 대해 아래 세 가지 분석을 수행하고 하나의 JSON 객체로 제공해주세요.
+
+        1. limitation - 사업화 과정에서 발생할 수 있는 잠재적 한계점과 위험 요소:
+           - 법률적 규제 및 제약(구체적인 법률명과 조항 포함)
+           - 특허 관련 이슈 및 지적재산권 문제(유사 특허 존재 여부)
+           - 시장 진입 장벽(기존 경쟁사, 초기 투자 요구 등)
+           - 기술적 제약 및 구현 난이도
+           - 잠재적 고객 수용성 문제
+           각 항목별로 구체적인 사례와 데이터를 포함해주세요.
+
+        2. opportunity - 기회 요인과 활용 가능한 지원 사업:
+           - 시장 기회 요인(최소 3가지): 해당 아이디어가 시장에서 성공할 수 있는 외부 환경 요인
+           - 활용 가능한 정부 지원 사업: 현재 지원 중이거나 곧 시작될 예정인 관련 지원 사업 정보
+           - 공모전 및 액셀러레이터 프로그램: 참여 가능한 공모전, 스타트업 지원 프로그램 등
+           - 각 지원 사업의 신청 시기 및 지원 내용: 구체적인 일정과 지원 금액
+           모든 정보는 최신 데이터를 기반으로 구체적으로 작성해주세요.
+
+        3. teamRequirement - 아이디어를 성공적으로 실현하기 위해 필요한 팀 구성:
+           - 필요한 직책/역할(최소 3가지): 구체적인 직함과 역할
+           - 각 역할별 필요 역량 및 경험: 구체적인 기술, 지식, 자격 요건
+           - 담당해야 할 업무 범위: 상세한 업무 내용
+           - 팀 구성의 우선순위: 초기 스타트업 단계에서 먼저 영입해야 할 역할 순서
+           최소 필요 인력부터 이상적인 팀 구성까지 단계별로 제안해주세요.
+
+        다음 JSON 형식으로 응답해주세요 (모든 필드 반드시 포함):
+        {
+            "limitation": "한계점 분석 내용",
+            "opportunity": "기회 분석 내용",
+            "teamRequirement": "팀 구성 분석 내용"
+        }
+
+        각 분석 내용은 한국어로 작성하고, 출처를 포함해주세요.
+        응답은 반드시 위 형식의 JSON 객체만 포함해야 합니다.
+        """
+    ).strip()
+
+    def __init__(
+        self,
+    ) -> None:
+        self._perplexity_client = get_perplexity_client()
+
+    async def execute(
+        self,
+        idea: str,
+        issues: List[str],
+        features: List[str],
+    ) -> CombinedAnalysisServiceResponse:
+        try:
+            # 재시도 시에도 동일한 프롬프트를 재사용
+            user_prompt = self._generate_prompt(idea, issues, features)
+
+            async def operation():
+                return await self._perplexity_client.fetch(
+                    user_prompt=user_prompt,
+                    system_prompt="You are a helpful assistant that provides accurate and detailed information in valid JSON format only.",
+                    timeout_seconds=self._TIMEOUT_SECONDS,
+                    temperature=self._TEMPERATURE,
+                    max_tokens=self._MAX_TOKENS,
+                    response_format=_RESPONSE_FORMAT,
+                    validator=self._parse_response,
+                )
+
+            return await retry(
+                function=operation,
+                max_attempts=self._MAX_ATTEMPTS,
+                non_retryable_exceptions=(ValidationError,),
+            )
+
+        except JSONValidationError as exception:
+            raise JSONValidationError(f"통합 분석 JSON 형식 검증 오류가 발생했습니다: {str(exception)}") from exception
+        except ValidationError as exception:
+            raise ModelValidationError(f"통합 분석 모델 검증 오류가 발생했습니다: {str(exception)}") from exception
+        except ExternalAPIError:
+            raise
+        except Exception as exception:
+            logger.error(f"통합 분석 서비스에서 오류가 발생했습니다: {str(exception)}")
+            raise AnalysisServiceError(f"통합 분석 서비스에서 오류가 발생했습니다: {str(exception)}") from exception
+
+    def _parse_response(
+        self,
+        content: str,
+    ) -> CombinedAnalysisServiceResponse:
+        return validate_json_model(_RESPONSE_ADAPTER, content)
+
+    def _generate_prompt(
+        self,
+        idea: str,
+        issues: List[str],
+        features: List[str],
+    ) -> str:
+        # 고정 지시문을 앞에, 입력값을 뒤에 배치하여 공급자의 프롬프트 prefix 캐시를 활용
+        return f"{self._PROMPT_PREFIX}\n\n비즈니스 아이디어: {idea}\n해결하고자 하는 문제: {to_compact_json(issues)}\n핵심 기능/요소: {to_compact_json(features)}"
@@ -1,7 +1,7 @@
 import logging
 
 from app.common.utils import retry
-from app.external.openai import OpenAIClient
+from app.external.openai import get_openai_client
 from app.common.exceptions import AnalysisServiceError, ExternalAPIError
 
 logger = logging.getLogger(__name__)
@@ -10,11 +10,11 @@ logger = logging.getLogger(__name__)
 class IdeaSummationService:
     _TIMEOUT_SECONDS = 60 * 2
     _TEMPERATURE = 0.7
-    _MAX_TOKENS = 1000
+    _MAX_TOKENS = 50
     _MAX_ATTEMPTS = 3
 
     def __init__(self) -> None:
-        self._openai_client = OpenAIClient()
+        self._openai_client = get_openai_client()
 
     async def execute(
         self,
@@ -2,8 +2,8 @@ import logging
 from textwrap import dedent
 from typing import List
 
-from app.common.utils import retry
-from app.external.perplexity import PerplexityClient
+from app.common.utils import retry, to_compact_json
+from app.external.perplexity import get_perplexity_client
 from app.common.exceptions import AnalysisServiceError, ExternalAPIError
 
 logger = logging.getLogger(__name__)
@@ -15,8 +15,28 @@ class LimitationAnalysisService:
     _MAX_TOKENS = 1000
     _MAX_ATTEMPTS = 3
 
+    _PROMPT_TEMPLATE = dedent(
+        """
+        다음 비즈니스 아이디어의 사업화 과정에서 발생할 수 있는 잠재적 한계점과 위험 요소를 상세히 분석해주세요:
+
+        비즈니스 아이디어: {idea}
+        해결하고자 하는 문제: {issues}
+        핵심 기능/요소: {features}
+
+        다음 정보를 포함한 분석이 필요합니다:
+        1. 법률적 규제 및 제약(구체적인 법률명과 조항 포함)
+        2. 특허 관련 이슈 및 지적재산권 문제(유사 특허 존재 여부)
+        3. 시장 진입 장벽(기존 경쟁사, 초기 투자 요구 등)
+        4. 기술적 제약 및 구현 난이도
+        5. 잠재적 고객 수용성 문제
+
+        각 항목별로 구체적인 사례와 데이터를 포함하여 분석해주세요.
+        응답은 한국어로 작성하고, 출처를 포함해주세요.
+        """
+    ).strip()
+
     def __init__(self) -> None:
-        self._perplexity_client = PerplexityClient()
+        self._perplexity_client = get_perplexity_client()
 
     async def execute(
         self,
@@ -52,22 +72,8 @@ class LimitationAnalysisService:
         issues: List[str],
         features: List[str],
     ) -> str:
-        return dedent(
-            f"""
-            다음 비즈니스 아이디어의 사업화 과정에서 발생할 수 있는 잠재적 한계점과 위험 요소를 상세히 분석해주세요:
-
-            비즈니스 아이디어: {idea}
-            해결하고자 하는 문제: {issues}
-            핵심 기능/요소: {features}
-
-            다음 정보를 포함한 분석이 필요합니다:
-            1. 법률적 규제 및 제약(구체적인 법률명과 조항 포함)
-            2. 특허 관련 이슈 및 지적재산권 문제(유사 특허 존재 여부)
-            3. 시장 진입 장벽(기존 경쟁사, 초기 투자 요구 등)
-            4. 기술적 제약 및 구현 난이도
-            5. 잠재적 고객 수용성 문제
-
-            각 항목별로 구체적인 사례와 데이터를 포함하여 분석해주세요.
-            응답은 한국어로 작성하고, 출처를 포함해주세요.
-            """
-        ).strip()
+        return self._PROMPT_TEMPLATE.format(
+            idea=idea,
+            issues=to_compact_json(issues),
+            features=to_compact_json(features),
+        )
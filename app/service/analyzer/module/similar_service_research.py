@@ -1,17 +1,22 @@
-import json
+import asyncio
 import logging
 from textwrap import dedent
-from typing import List
-from pydantic import BaseModel, Field, ValidationError
+from typing import List, Union
+from pydantic import BaseModel, ConfigDict, Field, RootModel, TypeAdapter, ValidationError
 
-from app.common.utils import retry, validate_json
-from app.external.perplexity import PerplexityClient
+from app.common.utils import retry, to_compact_json, validate_json_model
+from app.external.openai import get_openai_client
+from app.external.perplexity import get_perplexity_client
+from app.service.cache.semantic_response import SemanticResponseCache
 from app.common.exceptions import AnalysisServiceError, ExternalAPIError, JSONValidationError, ModelValidationError
 
 logger = logging.getLogger(__name__)
 
 
 class _Item(BaseModel):
+    # 반복되는 키/문자열(태그 등)을 JSON 파싱 시 재사용
+    model_config = ConfigDict(cache_strings="all")
+
     name: str
     url: str
     description: str
@@ -21,18 +26,61 @@ class _Item(BaseModel):
     similarity: int
 
 
-class SimilarServiceResearchServiceResponse(BaseModel):
-    items: List[_Item]
+class SimilarServiceResearchServiceResponse(RootModel[List[_Item]]):
+    pass
+
+
+_ITEM_ADAPTER = TypeAdapter(_Item)
+
+# 순위별 호출은 객체 하나를 반환하므로 응답 스키마를 강제하여 형식 오류로 인한 재시도를 줄임
+_ITEM_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"schema": _ITEM_ADAPTER.json_schema(by_alias=True)},
+}
 
 
 class SimilarServiceResearchService:
     _TIMEOUT_SECONDS = 60 * 3
     _TEMPERATURE = 0.3
-    _MAX_TOKENS = 2000
+    _ITEM_COUNT = 5
+    _MAX_TOKENS = 600  # 서비스 1개 기준
     _MAX_ATTEMPTS = 3
 
+    _PROMPT_PREFIX = dedent(
+        """
+        다음 비즈니스 아이디어와 유사한 서비스 1개를 JSON 형식으로 제공해주세요.
+
+        중요: 응답은 반드시 완전한 JSON 객체 하나로만 제공해주세요.
+
+        요구사항:
+        1. 실제 존재하는 서비스를 유사도가 높은 순으로 나열했을 때, 아래에 지정된 순위에 해당하는 서비스 1개만 선택해주세요.
+        2. 다음 JSON 형식으로 응답해주세요:
+        {
+          "name": "서비스 이름",
+          "url": "https://www.example.com",
+          "description": "300자 내외의 서비스 설명 - 핵심 기능과 특징 포함",
+          "targetAudience": "주요 타겟층 설명",
+          "tags": ["태그1", "태그2", "태그3", "태그4"],
+          "summary": "30자 내외의 서비스 한줄 요약",
+          "similarity": 85
+        }
+
+        주의사항:
+        - 응답은 위 JSON 객체만 포함해야 합니다
+        - 설명 텍스트, 마크다운 등은 절대 포함하지 마세요
+        - description은 300자 내외로 간결하게 작성해주세요
+        - tags는 4개로 제한합니다
+        - 응답은 한국어로 작성해주세요
+        - JSON이 완전히 닫혀있는지 확인해주세요
+        """
+    ).strip()
+
     def __init__(self) -> None:
-        self._perplexity_client = PerplexityClient()
+        self._perplexity_client = get_perplexity_client()
+        self._semantic_cache = SemanticResponseCache(
+            namespace="similar_service_research",
+            openai_client=get_openai_client(),
+        )
 
     async def execute(
         self,
@@ -41,32 +89,40 @@ class SimilarServiceResearchService:
     ) -> SimilarServiceResearchServiceResponse:
         try:
 
-            async def operation():
-                content = await self._perplexity_client.fetch(
-                    user_prompt=self._generate_prompt(idea, features),
-                    system_prompt="You are a helpful assistant that provides accurate and detailed information in valid JSON format only.",
-                    timeout_seconds=self._TIMEOUT_SECONDS,
-                    temperature=self._TEMPERATURE,
-                    max_tokens=self._MAX_TOKENS,
+            async def fetch_item(rank: int) -> _Item:
+                # 재시도 시에도 동일한 프롬프트를 재사용
+                user_prompt = self._generate_prompt(idea, features, rank)
+
+                async def operation():
+                    return await self._perplexity_client.fetch(
+                        user_prompt=user_prompt,
+                        system_prompt="You are a helpful assistant that provides accurate and detailed information in valid JSON format only.",
+                        timeout_seconds=self._TIMEOUT_SECONDS,
+                        temperature=self._TEMPERATURE,
+                        max_tokens=self._MAX_TOKENS,
+                        response_format=_ITEM_RESPONSE_FORMAT,
+                        validator=self._parse_item,
+                    )
+
+                return await retry(
+                    function=operation,
+                    max_attempts=self._MAX_ATTEMPTS,
+                    non_retryable_exceptions=(ValidationError,),
                 )
 
-                # 디버깅: 원본 응답 로깅
-                logger.debug(f"Perplexity 원본 응답 길이: {len(content)}")
-                logger.debug(f"Perplexity 원본 응답 (처음 500자): {content[:500]}")
-                logger.debug(f"Perplexity 원본 응답 (마지막 500자): {content[-500:]}")
-
-                validated_json = validate_json(content)
-                parsed_data = json.loads(validated_json)
-
-                # 응답 검증: 리스트이고 최소 1개 이상의 항목이 있는지 확인
-                if not isinstance(parsed_data, list) or len(parsed_data) == 0:
-                    raise JSONValidationError("응답이 유효한 배열이 아니거나 비어있습니다")
-
-                return SimilarServiceResearchServiceResponse(items=parsed_data)
+            async def fetch_items() -> SimilarServiceResearchServiceResponse:
+                # 한 번의 호출로 5개를 순차 생성하는 대신 순위별로 동시에 요청
+                results = await asyncio.gather(
+                    *(fetch_item(rank) for rank in range(1, self._ITEM_COUNT + 1)),
+                    return_exceptions=True,
+                )
+                return self._merge_items(results)
 
-            return await retry(
-                function=operation,
-                max_attempts=self._MAX_ATTEMPTS,
+            # 표현만 다른 동일 아이디어는 이전 조사 결과를 재사용
+            return await self._semantic_cache.get_or_execute(
+                text=f"{idea} {' '.join(features)}",
+                function=fetch_items,
+                is_cacheable=lambda response: len(response.root) == self._ITEM_COUNT,
             )
 
         except JSONValidationError as exception:
@@ -76,43 +132,45 @@ class SimilarServiceResearchService:
         except ExternalAPIError:
             raise
         except Exception as exception:
-            logger.error(f"유사 서비스 조사 서비스에서 오류가 발생했습니다: {str(exception)}")
+            logger.error("유사 서비스 조사 서비스에서 오류가 발생했습니다: %s", exception)
             raise AnalysisServiceError(f"유사 서비스 조사 서비스에서 오류가 발생했습니다: {str(exception)}") from exception
 
+    def _merge_items(
+        self,
+        results: List[Union[_Item, BaseException]],
+    ) -> SimilarServiceResearchServiceResponse:
+        items: List[_Item] = []
+        seen = set()
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.warning("유사 서비스 조회 일부 실패: %s", result)
+                continue
+
+            # 순위별 호출이 같은 서비스를 반환한 경우 중복 제거
+            key = (result.name.strip().lower(), result.url.strip().rstrip("/").lower())
+            if key in seen:
+                continue
+            seen.add(key)
+            items.append(result)
+
+        # 모든 호출이 실패한 경우 첫 번째 오류를 전파
+        if not items:
+            raise next(result for result in results if isinstance(result, BaseException))
+
+        items.sort(key=lambda item: item.similarity, reverse=True)
+        return SimilarServiceResearchServiceResponse.model_construct(root=items)
+
+    def _parse_item(
+        self,
+        content: str,
+    ) -> _Item:
+        return validate_json_model(_ITEM_ADAPTER, content)
+
     def _generate_prompt(
         self,
         idea: str,
         features: List[str],
+        rank: int,
     ) -> str:
-        return dedent(
-            f"""
-            다음 비즈니스 아이디어와 유사한 서비스를 JSON 형식으로 제공해주세요:
-            비즈니스 아이디어: {idea}
-            핵심 기능/요소: {features}
-            
-            중요: 응답은 반드시 완전한 JSON 배열 형태로만 제공해주세요.
-            
-            요구사항:
-            1. 실제 존재하는 서비스 중 유사도가 높은 상위 5개만 선별해주세요.
-            2. 다음 JSON 형식으로 응답해주세요:
-            [
-              {{
-                "name": "서비스 이름",
-                "url": "https://www.example.com",
-                "description": "300자 내외의 서비스 설명 - 핵심 기능과 특징 포함",
-                "targetAudience": "주요 타겟층 설명",
-                "tags": ["태그1", "태그2", "태그3", "태그4"],
-                "summary": "30자 내외의 서비스 한줄 요약",
-                "similarity": 85
-              }}
-            ]
-            
-            주의사항:
-            - 응답은 위 JSON 배열만 포함해야 합니다
-            - 설명 텍스트, 마크다운 등은 절대 포함하지 마세요
-            - description은 300자 내외로 간결하게 작성해주세요 (기존 500자에서 단축)
-            - tags는 4개로 제한합니다
-            - 응답은 한국어로 작성해주세요
-            - JSON이 완전히 닫혀있는지 확인해주세요
-            """
-        ).strip()
+        # 고정 지시문을 앞에, 입력값을 뒤에 배치하여 공급자의 프롬프트 prefix 캐시를 활용
+        return f"{self._PROMPT_PREFIX}\n\n유사도 순위: {rank}위\n비즈니스 아이디어: {idea}\n핵심 기능/요소: {to_compact_json(features)}"
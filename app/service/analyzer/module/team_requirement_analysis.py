@@ -2,8 +2,10 @@ import logging
 from textwrap import dedent
 from typing import List
 
-from app.common.utils import retry
-from app.external.perplexity import PerplexityClient
+from app.common.utils import retry, to_compact_json
+from app.external.openai import get_openai_client
+from app.external.perplexity import get_perplexity_client
+from app.service.cache.semantic_response import SemanticResponseCache
 from app.common.exceptions import AnalysisServiceError, ExternalAPIError
 
 logger = logging.getLogger(__name__)
@@ -15,8 +17,27 @@ class TeamRequirementAnalysisService:
     _MAX_TOKENS = 1000
     _MAX_ATTEMPTS = 3
 
+    _PROMPT_PREFIX = dedent(
+        """
+        다음 비즈니스 아이디어를 성공적으로 실현하기 위해 필요한 팀 구성을 상세히 분석해주세요.
+
+        다음 정보를 포함한 분석이 필요합니다:
+        1. 필요한 직책/역할(최소 3가지): 구체적인 직함과 역할
+        2. 각 역할별 필요 역량 및 경험: 구체적인 기술, 지식, 자격 요건
+        3. 담당해야 할 업무 범위: 상세한 업무 내용
+        4. 팀 구성의 우선순위: 초기 스타트업 단계에서 먼저 영입해야 할 역할 순서
+
+        최소 필요 인력부터 이상적인 팀 구성까지 단계별로 제안해주세요.
+        응답은 한국어로 작성하고, 출처를 포함해주세요.
+        """
+    ).strip()
+
     def __init__(self) -> None:
-        self._perplexity_client = PerplexityClient()
+        self._perplexity_client = get_perplexity_client()
+        self._semantic_cache = SemanticResponseCache(
+            namespace="team_requirement_analysis",
+            openai_client=get_openai_client(),
+        )
 
     async def execute(
         self,
@@ -25,19 +46,25 @@ class TeamRequirementAnalysisService:
         features: List[str],
     ) -> str:
         try:
+            # 재시도 시에도 동일한 프롬프트를 재사용
+            user_prompt = self._generate_prompt(idea, issues, features)
 
             async def operation():
                 return await self._perplexity_client.fetch(
-                    user_prompt=self._generate_prompt(idea, issues, features),
+                    user_prompt=user_prompt,
                     system_prompt="You are a helpful assistant that provides accurate and detailed information.",
                     timeout_seconds=self._TIMEOUT_SECONDS,
                     temperature=self._TEMPERATURE,
                     max_tokens=self._MAX_TOKENS,
                 )
 
-            return await retry(
-                function=operation,
-                max_attempts=self._MAX_ATTEMPTS,
+            # 표현만 다른 동일 아이디어는 이전 분석 결과를 재사용
+            return await self._semantic_cache.get_or_execute(
+                text=f"{idea} {' '.join(issues)} {' '.join(features)}",
+                function=lambda: retry(
+                    function=operation,
+                    max_attempts=self._MAX_ATTEMPTS,
+                ),
             )
 
         except ExternalAPIError:
@@ -52,21 +79,5 @@ class TeamRequirementAnalysisService:
         issues: List[str],
         features: List[str],
     ) -> str:
-        return dedent(
-            f"""
-            다음 비즈니스 아이디어를 성공적으로 실현하기 위해 필요한 팀 구성을 상세히 분석해주세요:
-
-            비즈니스 아이디어: {idea}
-            해결하고자 하는 문제: {issues}
-            핵심 기능/요소: {features}
-
-            다음 정보를 포함한 분석이 필요합니다:
-            1. 필요한 직책/역할(최소 3가지): 구체적인 직함과 역할
-            2. 각 역할별 필요 역량 및 경험: 구체적인 기술, 지식, 자격 요건
-            3. 담당해야 할 업무 범위: 상세한 업무 내용
-            4. 팀 구성의 우선순위: 초기 스타트업 단계에서 먼저 영입해야 할 역할 순서
-            
-            최소 필요 인력부터 이상적인 팀 구성까지 단계별로 제안해주세요.
-            응답은 한국어로 작성하고, 출처를 포함해주세요.
-            """
-        ).strip()
+        # 고정 지시문을 앞에, 입력값을 뒤에 배치하여 공급자의 프롬프트 prefix 캐시를 활용
+        return f"{self._PROMPT_PREFIX}\n\n비즈니스 아이디어: {idea}\n해결하고자 하는 문제: {to_compact_json(issues)}\n핵심 기능/요소: {to_compact_json(features)}"
@@ -1,14 +1,18 @@
 import asyncio
 import logging
-import random
+from functools import lru_cache
 from pydantic import BaseModel
 
 from app.common.enums import TaskStatus
+from app.core.config import setting
+from app.common.utils import gather_or_cancel
+from app.common.exceptions import CacheError
 from app.core.cache import get_static_redis_session
 from app.service.analyzer.module.business_case_extraction import (
     BusinessCaseExtractionService,
     BusinessCaseExtractionServiceResponse,
 )
+from app.service.analyzer.module.combined_analysis import CombinedAnalysisService
 from app.service.analyzer.module.limitation_analysis import LimitationAnalysisService
 from app.service.analyzer.module.opportunity_analysis import OpportunityAnalysisService
 from app.service.analyzer.module.similar_service_research import (
@@ -33,17 +37,63 @@ class PreAnalysisDataServiceResponse(BaseModel):
     team_requirement: str
 
 
+# 하위 서비스는 상태가 없으므로 요청마다 생성하지 않고 프로세스 단위로 재사용
+@lru_cache(maxsize=1)
+def _get_business_case_extraction_service() -> BusinessCaseExtractionService:
+    return BusinessCaseExtractionService()
+
+
+@lru_cache(maxsize=1)
+def _get_idea_summation_service() -> IdeaSummationService:
+    return IdeaSummationService()
+
+
+@lru_cache(maxsize=1)
+def _get_similar_service_research_service() -> SimilarServiceResearchService:
+    return SimilarServiceResearchService()
+
+
+@lru_cache(maxsize=1)
+def _get_market_research_service() -> MarketResearchService:
+    return MarketResearchService()
+
+
+@lru_cache(maxsize=1)
+def _get_limitation_analysis_service() -> LimitationAnalysisService:
+    return LimitationAnalysisService()
+
+
+@lru_cache(maxsize=1)
+def _get_opportunity_analysis_service() -> OpportunityAnalysisService:
+    return OpportunityAnalysisService()
+
+
+@lru_cache(maxsize=1)
+def _get_team_requirement_analysis_service() -> TeamRequirementAnalysisService:
+    return TeamRequirementAnalysisService()
+
+
+@lru_cache(maxsize=1)
+def _get_combined_analysis_service() -> CombinedAnalysisService:
+    return CombinedAnalysisService()
+
+
 class PreAnalysisDataService:
+    _BUSINESS_CASE_PROGRESS = 0.06
+    _PRE_ANALYSIS_PROGRESS = 0.17
+    _PRE_ANALYSIS_COMPLETED_PROGRESS = 0.21
+
     def __init__(
         self,
     ) -> None:
-        self._business_case_extraction_service = BusinessCaseExtractionService()
-        self._idea_summation_service = IdeaSummationService()
-        self._similar_service_research_service = SimilarServiceResearchService()
-        self._market_research_service = MarketResearchService()
-        self._limitation_analysis_service = LimitationAnalysisService()
-        self._opportunity_analysis_service = OpportunityAnalysisService()
-        self._team_requirement_analysis_servce = TeamRequirementAnalysisService()
+        self._business_case_extraction_service = _get_business_case_extraction_service()
+        self._idea_summation_service = _get_idea_summation_service()
+        self._similar_service_research_service = _get_similar_service_research_service()
+        self._market_research_service = _get_market_research_service()
+        self._limitation_analysis_service = _get_limitation_analysis_service()
+        self._opportunity_analysis_service = _get_opportunity_analysis_service()
+        self._team_requirement_analysis_servce = _get_team_requirement_analysis_service()
+        self._combined_analysis_service = _get_combined_analysis_service()
 
     async def analyze(
         self,
@@ -55,42 +105,54 @@ class PreAnalysisDataService:
             redis = await get_static_redis_session()
             self._task_progress_cache = TaskProgressCache(session=redis)
 
-            # 1. 비즈니스 케이스(5개) 추출
-            logger.info(f"비즈니스 케이스 추출 중")
-            await self._task_progress_cache.update_partial(
-                key=task_id,
-                progress=round(random.uniform(0.00, 0.06), 2),
-                message="비즈니스 케이스 추출 중입니다...",
+            # 1. 비즈니스 케이스(5개) 추출 및 아이디어 요약 (서로 독립적이므로 동시 실행)
+            logger.info(f"비즈니스 케이스 추출 및 아이디어 요약 중")
+            # 진행률 저장은 LLM 호출과 함께 실행하여 Redis 왕복을 기다리지 않음
+            business_case, idea, _ = await gather_or_cancel(
+                self._business_case_extraction_service.execute(problem, solution),
+                self._idea_summation_service.execute(problem, solution),
+                self._update_progress(task_id, self._BUSINESS_CASE_PROGRESS, "비즈니스 케이스 추출 및 아이디어 요약 중입니다..."),
             )
-            business_case = await self._business_case_extraction_service.execute(problem, solution)
             issues = business_case.problem.issues
             features, method = business_case.solution.features, business_case.solution.method
 
-            # 2. 아이디어 요약
-            logger.info(f"아이디어 요약 중")
-            await self._task_progress_cache.update_partial(
-                key=task_id,
-                progress=round(random.uniform(0.06, 0.12), 2),
-                message="아이디어 요약 중입니다...",
-            )
-            idea = await self._idea_summation_service.execute(problem, solution)
-
-            # 3. 사전 분석 데이터 준비
+            # 2. 사전 분석 데이터 준비
             logger.info(f"사전 분석 데이터 준비 중")
-            await self._task_progress_cache.update_partial(
-                key=task_id,
-                progress=round(random.uniform(0.12, 0.17), 2),
-                message="사전 분석 데이터 준비 중입니다...",
-            )
-            (similar_service, market, limitation, opportunity, team_requirement) = await asyncio.gather(
-                self._similar_service_research_service.execute(idea, features),
-                self._market_research_service.execute(idea, issues, features, method),
-                self._limitation_analysis_service.execute(idea, issues, features),
-                self._opportunity_analysis_service.execute(idea, issues, features),
-                self._team_requirement_analysis_servce.execute(idea, issues, features),
+            # 시작 진행률 저장은 LLM 호출과 함께 실행하고, 이후 하위 분석이 끝날 때마다 진행률을 갱신
+            start_update = asyncio.create_task(
+                self._update_progress(task_id, self._PRE_ANALYSIS_PROGRESS, "사전 분석 데이터 준비 중입니다...")
             )
 
-            return PreAnalysisDataServiceResponse(
+            async def on_complete(completed: int, total: int) -> None:
+                await start_update  # 시작 진행률보다 먼저 저장되지 않도록 대기
+                progress = self._PRE_ANALYSIS_PROGRESS + (self._PRE_ANALYSIS_COMPLETED_PROGRESS - self._PRE_ANALYSIS_PROGRESS) * completed / total
+                await self._update_progress(task_id, round(progress, 2), f"사전 분석 데이터 준비 중입니다... ({completed}/{total})")
+
+            try:
+                if setting.COMBINED_ANALYSIS:
+                    # 입력이 같은 한계점/기회/팀 구성 분석은 한 번의 호출로 처리
+                    similar_service, market, combined = await gather_or_cancel(
+                        self._similar_service_research_service.execute(idea, features),
+                        self._market_research_service.execute(idea, issues, features, method),
+                        self._combined_analysis_service.execute(idea, issues, features),
+                        on_complete=on_complete,
+                    )
+                    limitation, opportunity, team_requirement = combined.limitation, combined.opportunity, combined.team_requirement
+                else:
+                    (similar_service, market, limitation, opportunity, team_requirement) = await gather_or_cancel(
+                        self._similar_service_research_service.execute(idea, features),
+                        self._market_research_service.execute(idea, issues, features, method),
+                        self._limitation_analysis_service.execute(idea, issues, features),
+                        self._opportunity_analysis_service.execute(idea, issues, features),
+                        self._team_requirement_analysis_servce.execute(idea, issues, features),
+                        on_complete=on_complete,
+                    )
+            finally:
+                # 실패 상태 저장이 시작 진행률에 덮어써지지 않도록 마무리
+                await start_update
+
+            # 하위 서비스 응답은 이미 검증되었으므로 재검증 없이 조립
+            return PreAnalysisDataServiceResponse.model_construct(
                 idea=idea,
                 business_case=business_case,
                 similar_service=similar_service,
@@ -106,3 +168,18 @@ class PreAnalysisDataService:
                 message=f"사전 분석 데이터 준비 중 오류가 발생했습니다. 나중에 다시 시도해 주세요.",
             )
             raise
+
+    async def _update_progress(
+        self,
+        task_id: str,
+        progress: float,
+        message: str,
+    ) -> None:
+        try:
+            await self._task_progress_cache.update_partial(
+                key=task_id,
+                progress=progress,
+                message=message,
+            )
+        except CacheError as exception:
+            logger.warning(f"사전 분석 진행률 저장 실패: {str(exception)}")
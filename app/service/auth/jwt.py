@@ -1,7 +1,9 @@
+import time
 from datetime import datetime, timedelta, timezone
-from typing import List
-from jose import ExpiredSignatureError, JWTError as JoseJWTError, jwt
-from pydantic import BaseModel, ValidationError
+from functools import lru_cache
+from typing import List, Tuple
+import jwt
+from pydantic import BaseModel, ConfigDict
 
 from app.core.config import setting
 from app.common.enums import UserRole
@@ -9,14 +11,44 @@ from app.common.exceptions import JWTEncodeError, JWTDecodeError, JWTExpiredErro
 
 
 class Payload(BaseModel):
+    # 디코딩 결과를 캐시하여 여러 요청이 같은 인스턴스를 공유하므로 변경 불가로 고정
+    model_config = ConfigDict(frozen=True)
+
     id: int
     name: str
     roles: List[UserRole]
 
 
+_PAYLOAD_FIELDS = frozenset(Payload.model_fields)
+
+# 서명 키와 디코딩 옵션은 호출마다 만들지 않고 한 번만 구성
+_ALGORITHM = "HS256"
+_SECRET_KEY = setting.JWT_SECRET.encode("utf-8")
+_DECODE_ALGORITHMS = [_ALGORITHM]
+_DECODE_OPTIONS = {"require": ["exp"]}
+
+
+@lru_cache(maxsize=4096)
+def _decode_token(
+    token: str,
+) -> Tuple[Payload, float]:
+    # 같은 토큰이 만료 전까지 반복 사용되므로 서명 검증 및 페이로드 구성 결과를 캐시 (예외는 캐시되지 않음)
+    raw_payload = jwt.decode(
+        token,
+        _SECRET_KEY,
+        algorithms=_DECODE_ALGORITHMS,
+        options=_DECODE_OPTIONS,  # type: ignore
+    )
+
+    # 서명으로 무결성이 보장된 자체 발급 토큰이므로 검증 없이 구성 (roles만 enum으로 변환)
+    payload_data = {key: raw_payload[key] for key in _PAYLOAD_FIELDS}
+    payload_data["roles"] = [UserRole(role) for role in payload_data["roles"]]
+
+    return Payload.model_construct(**payload_data), raw_payload["exp"]
+
+
 class JWTService:
     _EXPIRE_DAY = 3
-    _ALGORITHM = "HS256"
 
     @staticmethod
     def encode(
@@ -37,8 +69,8 @@ class JWTService:
 
             return jwt.encode(
                 payload_dict,
-                setting.JWT_SECRET,
-                algorithm=JWTService._ALGORITHM,
+                _SECRET_KEY,
+                algorithm=_ALGORITHM,
             )
 
         except Exception as exception:
@@ -49,23 +81,21 @@ class JWTService:
         token: str,
     ) -> Payload:
         try:
-            raw_payload = jwt.decode(
-                token,
-                setting.JWT_SECRET,
-                algorithms=[JWTService._ALGORITHM],
-                options={"verify_signature": True},
-            )
+            payload, expire_time = _decode_token(token)
 
-            # Payload 모델에 정의된 필드만 추출
-            payload_data = {key: value for key, value in raw_payload.items() if key in Payload.model_fields}
+            # 캐시된 토큰도 만료 시각은 매번 확인
+            if expire_time <= time.time():
+                raise JWTExpiredError("JWT 토큰이 만료되었습니다")
 
-            return Payload.model_validate(payload_data)
+            return payload
 
-        except ExpiredSignatureError as exception:
+        except jwt.ExpiredSignatureError as exception:
             raise JWTExpiredError("JWT 토큰이 만료되었습니다") from exception
-        except JoseJWTError as exception:
+        except jwt.InvalidTokenError as exception:
             raise JWTInvalidError(f"JWT 토큰이 유효하지 않습니다: {str(exception)}") from exception
-        except ValidationError as exception:
+        except (KeyError, TypeError, ValueError) as exception:
             raise JWTDecodeError(f"JWT 페이로드 데이터가 올바르지 않습니다: {str(exception)}") from exception
+        except JWTExpiredError:
+            raise
         except Exception as exception:
             raise JWTDecodeError(f"JWT 토큰 검증 중 예상치 못한 오류가 발생했습니다: {str(exception)}") from exception
@@ -26,22 +26,27 @@ def _create_oauth() -> OAuth:
     return oauth
 
 
+@lru_cache(maxsize=len(OauthProvider))
+def _create_oauth_client(
+    provider: OauthProvider,
+):
+    # 공급자별 클라이언트를 한 번만 조회하여 재사용
+    return _create_oauth().create_client(provider.value)
+
+
 class RawOAuthProfile(BaseModel):
     name: str
     email: str
 
 
 class OAuthService:
-    def __init__(self) -> None:
-        self._oauth_client = _create_oauth()
-
     async def redirect_authorization(
         self,
         request: Request,
         provider: OauthProvider,
     ) -> RedirectResponse:
         try:
-            client = self._oauth_client.create_client(provider.value)
+            client = _create_oauth_client(provider)
             redirect_url = request.url_for("handle_oauth_callback", provider=provider.value)
 
             return await client.authorize_redirect(request, redirect_uri=redirect_url)  # type: ignore
@@ -57,13 +62,13 @@ class OAuthService:
         provider: OauthProvider,
     ) -> RawOAuthProfile:
         try:
-            client = self._oauth_client.create_client(provider.value)
+            client = _create_oauth_client(provider)
 
             token = await client.authorize_access_token(request)  # type: ignore
             response = await client.get("userinfo", token=token)  # type: ignore
-            user_info = response.json()
 
-            return RawOAuthProfile.model_validate(user_info)
+            # 응답 바이트를 dict로 거치지 않고 한 번에 파싱 및 검증
+            return RawOAuthProfile.model_validate_json(response.content)
 
         except ValidationError as exception:
             raise OAuthDataCorruptedError(f"OAuth 프로필 데이터 형식이 올바르지 않습니다: {str(exception)}") from exception
@@ -34,6 +34,7 @@ class BaseCache(ABC, Generic[T]):
             raise ValueError("_DATA_CLASS가 설정되지 않았습니다. 하위 클래스에서 정의해야 합니다.")
 
         self._session = session
+        self._key_prefix = f"{self._BASE_KEY}:"  # 호출마다 키 접두사를 포맷하지 않도록 미리 구성
 
     async def set(
         self,
@@ -48,7 +49,7 @@ class BaseCache(ABC, Generic[T]):
             # 키 생성 함수 정의
             async def operation():
                 key = secrets.token_urlsafe(16)
-                full_key = f"{self._BASE_KEY}:{key}"
+                full_key = self._key_prefix + key
 
                 is_success = await self._session.set(
                     name=full_key,
@@ -84,18 +85,14 @@ class BaseCache(ABC, Generic[T]):
         key: str,
     ) -> Optional[T]:
         try:
-            full_key = f"{self._BASE_KEY}:{key}"
+            full_key = self._key_prefix + key
 
             # Redis에서 데이터 조회
             data_json = await self._session.get(full_key)
             if data_json is None:
                 return None
 
-            # bytes를 문자열로 변환
-            if isinstance(data_json, bytes):
-                data_json = data_json.decode('utf-8')
-
-            # JSON 데이터를 모델로 파싱
+            # JSON 데이터를 모델로 파싱 (str/bytes 모두 그대로 전달)
             parsed_data = self._DATA_CLASS.model_validate_json(data_json)
             return parsed_data
 
@@ -121,33 +118,29 @@ class BaseCache(ABC, Generic[T]):
         expire_delta: Optional[timedelta] = None,
     ) -> bool:
         try:
-            full_key = f"{self._BASE_KEY}:{key}"
-
-            # 키 존재 여부 확인
-            existing_data = await self._session.get(full_key)
-            if existing_data is None:
-                return False
+            full_key = self._key_prefix + key
 
             # 데이터 직렬화
             data_json = data.model_dump_json()
 
-            # TTL 처리 및 데이터 업데이트
+            # 존재 확인/TTL 조회 없이 한 번의 SET으로 저장 (xx: 키가 있을 때만 저장, keepttl: 기존 TTL 유지)
             if expire_delta is not None:
                 expire_time = int(expire_delta.total_seconds())
-                await self._session.set(
+                result = await self._session.set(
                     name=full_key,
                     value=data_json,
                     ex=expire_time,
+                    xx=True,
                 )
             else:
-                current_ttl = await self._session.ttl(full_key)
-                await self._session.set(
+                result = await self._session.set(
                     name=full_key,
                     value=data_json,
-                    ex=current_ttl,
+                    keepttl=True,
+                    xx=True,
                 )
 
-            return True
+            return bool(result)
 
         except ValidationError as exception:
             raise CacheSerializationError(f"데이터 직렬화 중 오류가 발생했습니다: {str(exception)}") from exception
@@ -163,7 +156,7 @@ class BaseCache(ABC, Generic[T]):
         key: str,
     ) -> bool:
         try:
-            full_key = f"{self._BASE_KEY}:{key}"
+            full_key = self._key_prefix + key
 
             # 캐시에서 키 삭제
             result = await self._session.delete(full_key)
@@ -0,0 +1,166 @@
+import logging
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from functools import wraps
+from hashlib import blake2b
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from redis.asyncio import Redis
+from redis.exceptions import RedisError, ConnectionError
+
+from app.core.cache import get_static_redis_session
+from app.common.singleflight import SingleFlight
+from app.common.exceptions import CacheError, CacheConnectionError
+
+logger = logging.getLogger(__name__)
+
+
+class LLMResponseCache:
+    _BASE_KEY = "llm_response"
+    _EXPIRE_DELTA = timedelta(hours=24)
+    _MEMORY_MAX_SIZE = 512
+    _MAX_CACHEABLE_TEMPERATURE = 0.7
+
+    # 프로세스 단위 메모리 캐시 (key -> (만료 시각, 응답))
+    _memory: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+    def __init__(
+        self,
+        session: Redis,
+    ) -> None:
+        self._session = session
+
+    @classmethod
+    def generate_key(
+        cls,
+        model: str,
+        user_prompt: str,
+        system_prompt: str,
+        temperature: float,
+        max_tokens: int,
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> Optional[str]:
+        # 높은 temperature는 다양한 응답이 목적이므로 캐시하지 않음
+        if temperature > cls._MAX_CACHEABLE_TEMPERATURE:
+            return None
+
+        digest = blake2b(digest_size=16)
+        for part in (model, system_prompt, user_prompt, str(temperature), str(max_tokens), str(response_format)):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    async def get(
+        self,
+        key: str,
+    ) -> Optional[str]:
+        # 1. 메모리 캐시 조회
+        entry = self._memory.get(key)
+        if entry is not None:
+            expire_at, content = entry
+            if expire_at > time.monotonic():
+                self._memory.move_to_end(key)
+                return content
+            self._memory.pop(key, None)
+
+        # 2. Redis 캐시 조회
+        try:
+            content = await self._session.get(f"{self._BASE_KEY}:{key}")
+        except ConnectionError as exception:
+            raise CacheConnectionError(f"Redis 연결 오류로 LLM 응답 캐시 조회에 실패했습니다: {str(exception)}") from exception
+        except RedisError as exception:
+            raise CacheError(f"Redis 오류로 LLM 응답 캐시 조회에 실패했습니다: {str(exception)}") from exception
+
+        if content is None:
+            return None
+        if isinstance(content, bytes):
+            content = content.decode("utf-8")
+
+        self._remember(key, content)
+        return content
+
+    async def set(
+        self,
+        key: str,
+        content: str,
+    ) -> None:
+        self._remember(key, content)
+
+        try:
+            await self._session.set(
+                name=f"{self._BASE_KEY}:{key}",
+                value=content,
+                ex=int(self._EXPIRE_DELTA.total_seconds()),
+            )
+        except ConnectionError as exception:
+            raise CacheConnectionError(f"Redis 연결 오류로 LLM 응답 캐시 저장에 실패했습니다: {str(exception)}") from exception
+        except RedisError as exception:
+            raise CacheError(f"Redis 오류로 LLM 응답 캐시 저장에 실패했습니다: {str(exception)}") from exception
+
+    def _remember(
+        self,
+        key: str,
+        content: str,
+    ) -> None:
+        self._memory[key] = (time.monotonic() + self._EXPIRE_DELTA.total_seconds(), content)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._MEMORY_MAX_SIZE:
+            self._memory.popitem(last=False)
+
+
+_single_flight: SingleFlight[Any] = SingleFlight()
+
+
+def cache_llm_response(
+    function: Callable[..., Awaitable[str]],
+) -> Callable[..., Awaitable[Any]]:
+    """LLM 클라이언트의 fetch 결과를 (프롬프트, temperature, 모델) 기준으로 캐시
+
+    validator가 주어지면 검증을 통과한 응답만 캐시하여 잘못된 응답이 재시도에서 재사용되지 않도록 하고,
+    응답 문자열 대신 validator의 결과를 반환하여 호출부에서 다시 파싱하지 않도록 함
+    """
+
+    @wraps(function)
+    async def wrapper(
+        self,
+        user_prompt: str,
+        system_prompt: str,
+        timeout_seconds: int,
+        temperature: float,
+        max_tokens: int,
+        model: Optional[str] = None,
+        validator: Optional[Callable[[str], Any]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        model = model or self._MODEL
+        key = LLMResponseCache.generate_key(model, user_prompt, system_prompt, temperature, max_tokens, kwargs.get("response_format"))
+        if key is None:
+            content = await function(self, user_prompt, system_prompt, timeout_seconds, temperature, max_tokens, model, **kwargs)
+            return validator(content) if validator is not None else content
+
+        async def operation() -> Any:
+            # 캐시 오류는 LLM 호출을 막지 않음
+            llm_response_cache = None
+            try:
+                llm_response_cache = LLMResponseCache(session=await get_static_redis_session())
+                cached_content = await llm_response_cache.get(key)
+                if cached_content is not None:
+                    return validator(cached_content) if validator is not None else cached_content
+            except (CacheError, RedisError, OSError) as exception:
+                logger.warning(f"LLM 응답 캐시 조회 실패: {str(exception)}")
+
+            content = await function(self, user_prompt, system_prompt, timeout_seconds, temperature, max_tokens, model, **kwargs)
+            result = validator(content) if validator is not None else content
+
+            if llm_response_cache is not None:
+                try:
+                    await llm_response_cache.set(key, content)
+                except CacheError as exception:
+                    logger.warning(f"LLM 응답 캐시 저장 실패: {str(exception)}")
+
+            return result
+
+        # 동일한 프롬프트의 동시 요청은 하나의 호출로 합침
+        return await _single_flight.do(key, operation)
+
+    return wrapper
@@ -0,0 +1,122 @@
+import logging
+import time
+from collections import defaultdict, deque
+from datetime import timedelta
+from math import sqrt
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple, TypeVar
+
+from app.external.openai import OpenAIClient
+from app.common.singleflight import SingleFlight
+from app.common.exceptions import ExternalAPIError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+Vector = Tuple[float, ...]
+
+
+_single_flight: SingleFlight[Any] = SingleFlight()
+
+
+class SemanticResponseCache:
+    _EMBEDDING_MODEL = "text-embedding-3-small"
+    _EMBEDDING_DIMENSIONS = 256
+    _EMBEDDING_TIMEOUT_SECONDS = 10
+    _SIMILARITY_THRESHOLD = 0.92
+    _EXPIRE_DELTA = timedelta(hours=24)
+    _MEMORY_MAX_SIZE = 256
+
+    # 네임스페이스별 프로세스 단위 캐시 (만료 시각, 정규화된 임베딩, 응답)
+    _memory: Dict[str, Deque[Tuple[float, Vector, Any]]] = defaultdict(deque)
+
+    def __init__(
+        self,
+        namespace: str,
+        openai_client: OpenAIClient,
+    ) -> None:
+        self._namespace = namespace
+        self._openai_client = openai_client
+
+    async def get_or_execute(
+        self,
+        text: str,
+        function: Callable[[], Awaitable[T]],
+        is_cacheable: Optional[Callable[[T], bool]] = None,
+    ) -> T:
+        text = " ".join(text.split())
+
+        # 동시에 들어온 동일한 입력은 하나의 조회/호출로 합침
+        return await _single_flight.do(
+            f"{self._namespace}:{text}",
+            lambda: self._get_or_execute(text, function, is_cacheable),
+        )
+
+    async def _get_or_execute(
+        self,
+        text: str,
+        function: Callable[[], Awaitable[T]],
+        is_cacheable: Optional[Callable[[T], bool]],
+    ) -> T:
+        # 임베딩 실패는 분석을 막지 않음
+        vector = None
+        try:
+            vector = await self._embed(text)
+        except ExternalAPIError as exception:
+            logger.warning(f"시맨틱 캐시 임베딩 실패: {str(exception)}")
+
+        if vector is not None:
+            cached_response = self._lookup(vector)
+            if cached_response is not None:
+                return cached_response
+
+        response = await function()
+
+        # 일부만 성공한 응답 등은 유사한 입력에 재사용되지 않도록 저장하지 않음
+        if vector is not None and (is_cacheable is None or is_cacheable(response)):
+            self._remember(vector, response)
+
+        return response
+
+    async def _embed(
+        self,
+        text: str,
+    ) -> Vector:
+        embedding = await self._openai_client.embed(
+            text=text,
+            timeout_seconds=self._EMBEDDING_TIMEOUT_SECONDS,
+            model=self._EMBEDDING_MODEL,
+            dimensions=self._EMBEDDING_DIMENSIONS,
+        )
+
+        # 정규화하여 내적만으로 코사인 유사도를 계산
+        norm = sqrt(sum(value * value for value in embedding)) or 1.0
+        return tuple(value / norm for value in embedding)
+
+    def _lookup(
+        self,
+        vector: Vector,
+    ) -> Optional[Any]:
+        entries = self._memory[self._namespace]
+
+        now = time.monotonic()
+        while entries and entries[0][0] <= now:
+            entries.popleft()
+
+        best_score, best_response = self._SIMILARITY_THRESHOLD, None
+        for _, cached_vector, response in entries:
+            score = sum(a * b for a, b in zip(vector, cached_vector))
+            if score >= best_score:
+                best_score, best_response = score, response
+
+        return best_response
+
+    def _remember(
+        self,
+        vector: Vector,
+        response: Any,
+    ) -> None:
+        entries = self._memory[self._namespace]
+        entries.append((time.monotonic() + self._EXPIRE_DELTA.total_seconds(), vector, response))
+        while len(entries) > self._MEMORY_MAX_SIZE:
+            entries.popleft()
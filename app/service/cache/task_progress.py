@@ -1,11 +1,14 @@
 from datetime import timedelta
-from typing import Optional
-from pydantic import BaseModel, ValidationError
+from textwrap import dedent
+from typing import List, Optional, Tuple
+from pydantic import BaseModel
+from pydantic_core import to_json
 from redis.asyncio import Redis
+from redis.exceptions import RedisError, ConnectionError
 
 from app.common.enums import TaskStatus
 from app.service.cache.base import BaseCache
-from app.common.exceptions import CacheError, CacheSerializationError
+from app.common.exceptions import CacheError, CacheConnectionError
 
 
 class TaskProgress(BaseModel):
@@ -22,11 +25,34 @@ class TaskProgressCache(BaseCache[TaskProgress]):
     _BASE_KEY = "task_progress"
     _DATA_CLASS = TaskProgress
 
+    # 기존 데이터에 변경 필드를 병합하여 저장 (TTL은 ARGV[2]가 없으면 유지, 키가 없으면 0 반환)
+    _UPDATE_PARTIAL_SCRIPT = dedent(
+        """
+        local data_json = redis.call('GET', KEYS[1])
+        if not data_json then
+            return 0
+        end
+
+        local data = cjson.decode(data_json)
+        for field, value in pairs(cjson.decode(ARGV[1])) do
+            data[field] = value
+        end
+
+        if ARGV[2] ~= '' then
+            redis.call('SET', KEYS[1], cjson.encode(data), 'EX', ARGV[2])
+        else
+            redis.call('SET', KEYS[1], cjson.encode(data), 'KEEPTTL')
+        end
+        return 1
+        """
+    ).strip()
+
     def __init__(
         self,
         session: Redis,
     ) -> None:
         super().__init__(session)
+        self._update_partial_script = session.register_script(self._UPDATE_PARTIAL_SCRIPT)
 
     async def update_partial(
         self,
@@ -41,25 +67,58 @@ class TaskProgressCache(BaseCache[TaskProgress]):
         expire_delta: Optional[timedelta] = None,
     ) -> bool:
         try:
-            # 기존 데이터 조회
-            current_data = await self.get(key)
-            if current_data is None:
-                return False
+            # 변경할 필드만 전달하여 조회/병합/저장을 서버에서 한 번에 처리
+            updates = {
+                field: value
+                for field, value in (
+                    ("status", status),
+                    ("progress", progress),
+                    ("message", message),
+                    ("host", host),
+                    ("user_id", user_id),
+                    ("project_id", project_id),
+                    ("start_time", start_time),
+                )
+                if value is not None
+            }
 
-            # 부분 업데이트
-            updated_data = TaskProgress(
-                status=status if status is not None else current_data.status,
-                progress=progress if progress is not None else current_data.progress,
-                message=message if message is not None else current_data.message,
-                host=host if host is not None else current_data.host,
-                user_id=user_id if user_id is not None else current_data.user_id,
-                project_id=project_id if project_id is not None else current_data.project_id,
-                start_time=start_time if start_time is not None else current_data.start_time,
+            result = await self._update_partial_script(
+                keys=[self._key_prefix + key],
+                args=[
+                    to_json(updates),
+                    int(expire_delta.total_seconds()) if expire_delta is not None else "",
+                ],
             )
+            return bool(result)
 
-            return await super().update(key, updated_data, expire_delta)
-
-        except ValidationError as exception:
-            raise CacheSerializationError(f"TaskProgress 데이터 생성 중 오류가 발생했습니다: {str(exception)}") from exception
+        except ConnectionError as exception:
+            raise CacheConnectionError(f"Redis 연결 오류로 부분 캐시 업데이트에 실패했습니다: {str(exception)}") from exception
+        except RedisError as exception:
+            raise CacheError(f"Redis 오류로 부분 캐시 업데이트에 실패했습니다: {str(exception)}") from exception
         except Exception as exception:
             raise CacheError(f"부분 캐시 업데이트 중 예상치 못한 오류가 발생했습니다: {str(exception)}") from exception
+
+    async def update_partial_batch(
+        self,
+        updates: List[Tuple[str, float, str]],
+    ) -> List[bool]:
+        """(key, progress, message) 목록을 순서대로 적용하여 한 번의 왕복으로 처리"""
+        try:
+            # update_partial과 같은 스크립트를 파이프라인으로 실행하여 병합 방식과 원자성을 공유 (기존 TTL 유지)
+            async with self._session.pipeline(transaction=False) as pipeline:
+                for key, progress, message in updates:
+                    await self._update_partial_script(
+                        keys=[self._key_prefix + key],
+                        args=[to_json({"progress": progress, "message": message}), ""],
+                        client=pipeline,
+                    )
+                results = await pipeline.execute()
+
+            return [bool(result) for result in results]
+
+        except ConnectionError as exception:
+            raise CacheConnectionError(f"Redis 연결 오류로 일괄 캐시 업데이트에 실패했습니다: {str(exception)}") from exception
+        except RedisError as exception:
+            raise CacheError(f"Redis 오류로 일괄 캐시 업데이트에 실패했습니다: {str(exception)}") from exception
+        except Exception as exception:
+            raise CacheError(f"일괄 캐시 업데이트 중 예상치 못한 오류가 발생했습니다: {str(exception)}") from exception
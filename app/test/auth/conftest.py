@@ -0,0 +1,20 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.test.mock_config import register_mock_env
+
+
+@pytest.fixture(scope="session")
+def client() -> TestClient:
+    # 환경 변수 등록과 앱 생성 비용을 auth 테스트 전체에서 공유
+    register_mock_env()
+
+    from app.main import app
+
+    return TestClient(app, raise_server_exceptions=False, follow_redirects=False)
+
+
+@pytest.fixture(autouse=True)
+def clear_session(client: TestClient) -> None:
+    # client를 공유하므로 이전 테스트의 세션 쿠키가 남지 않도록 초기화
+    client.cookies.clear()
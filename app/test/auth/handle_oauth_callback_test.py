@@ -1,148 +1,93 @@
-import pytest
+from types import SimpleNamespace
 from unittest import mock
 
-from app.test.mock_config import register_mock_env
-
-register_mock_env()
-
-from fastapi.testclient import TestClient
 from fastapi.responses import RedirectResponse
 
-from app.util.enum import OauthProvider
-from app.util.exception import (
-    OAuthServerException,
-    FieldMissingException,
-    CSRFException,
-    CacheServerException,
-)
-from app.service.auth.handle_oauth_callback import HandleOAuthCallbackService
-from app.main import app
-
-client = TestClient(app, raise_server_exceptions=False, follow_redirects=False)
-
+from app.common.enums import OauthProvider
+from app.common.exceptions import CacheError, OAuthProfileError
 
-@pytest.mark.asyncio
-async def test_handle_oauth_callback_success():
-    """
-    OAuth 콜백이 성공적으로 처리되고 리다이렉트되는 케이스 테스트
-    """
-    mock_frontend_url = "https://frontend.com/auth?token=mock_token"
+_FRONTEND_REDIRECT_URL = "http://localhost:3000/auth/callback"
+_CALLBACK_URL = f"/auth/oauth/{OauthProvider.GOOGLE.value}/callback?code=FYVjdmoq9RQ2UPYu_cCRhA&state=mock_state"
 
-    async def mock_exec(*args, **kwargs):
-        return RedirectResponse(url=mock_frontend_url, status_code=307)
-
-    mock_redis_session = mock.MagicMock()
 
+def _store_frontend_redirect_url(client):
+    # 리다이렉트 요청을 거쳐 세션에 frontend_redirect_url 저장
     with mock.patch(
-        "app.api.dep.get_redis_session",
-        return_value=mock_redis_session,
-    ), mock.patch.object(
-        HandleOAuthCallbackService, "exec", side_effect=mock_exec
+        "app.service.auth.oauth.OAuthService.redirect_authorization",
+        return_value=RedirectResponse(url="https://oauth-provider.com/auth"),
     ):
-        res = client.get(
-            f"/auth/oauth/{OauthProvider.GOOGLE.value}/callback?code=FYVjdmoq9RQ2UPYu_cCRhA&state=mock_state"
-        )
-        assert res.status_code == 307
-        assert res.headers["location"] == mock_frontend_url
+        client.get(f"/auth/oauth/{OauthProvider.GOOGLE.value}?frontend_redirect_url={_FRONTEND_REDIRECT_URL}")
 
 
-@pytest.mark.asyncio
-async def test_handle_oauth_callback_field_missing():
+def test_handle_oauth_callback_success(client):
     """
-    필수 파라미터가 누락된 경우 400 테스트
+    OAuth 콜백이 성공적으로 처리되고 리다이렉트되는 케이스 테스트
     """
-
-    async def mock_exec(*args, **kwargs):
-        raise FieldMissingException
-
-    mock_redis_session = mock.MagicMock()
+    _store_frontend_redirect_url(client)
 
     with mock.patch(
-        "app.api.dep.get_redis_session",
-        return_value=mock_redis_session,
-    ), mock.patch.object(
-        HandleOAuthCallbackService, "exec", side_effect=mock_exec
-    ):
-        res = client.get(f"/auth/oauth/{OauthProvider.GOOGLE.value}/callback")
-        assert res.status_code == 400
+        "app.service.auth.oauth.OAuthService.fetch_raw_oauth_profile",
+        return_value=SimpleNamespace(name="suehyun lee", email="suehyun@example.com"),
+    ), mock.patch(
+        "app.service.cache.oauth_profile.OAuthProfileCache.set",
+        return_value="mock_key",
+    ) as mock_set:
+        res = client.get(_CALLBACK_URL)
+        assert res.status_code == 307
+        assert res.headers["location"] == f"{_FRONTEND_REDIRECT_URL}?code=mock_key"
+        assert mock_set.await_args.kwargs["data"].host == "testclient"
 
 
-@pytest.mark.asyncio
-async def test_handle_oauth_callback_csrf_exception():
+def test_handle_oauth_callback_field_missing(client):
     """
-    CSRF 공격 가능성이 감지된 경우 403 테스트
+    필수 파라미터(code)가 누락된 경우 422 테스트
     """
-
-    async def mock_exec(*args, **kwargs):
-        raise CSRFException
-
-    mock_redis_session = mock.MagicMock()
-
-    with mock.patch(
-        "app.api.dep.get_redis_session",
-        return_value=mock_redis_session,
-    ), mock.patch.object(
-        HandleOAuthCallbackService, "exec", side_effect=mock_exec
-    ):
-        res = client.get(
-            f"/auth/oauth/{OauthProvider.GOOGLE.value}/callback?code=FYVjdmoq9RQ2UPYu_cCRhA&state=invalid_state"
-        )
-        assert res.status_code == 403
+    res = client.get(f"/auth/oauth/{OauthProvider.GOOGLE.value}/callback")
+    assert res.status_code == 422
 
 
-@pytest.mark.asyncio
-async def test_handle_oauth_callback_invalid_provider():
+def test_handle_oauth_callback_invalid_provider(client):
     """
     지원하지 않는 OAuth 제공자가 전달된 경우 422 테스트
     """
-
-    res = client.get(
-        "/auth/oauth/invalid_provider/callback?code=FYVjdmoq9RQ2UPYu_cCRhA&state=mock_state"
-    )
+    res = client.get("/auth/oauth/invalid_provider/callback?code=FYVjdmoq9RQ2UPYu_cCRhA&state=mock_state")
     assert res.status_code == 422
 
 
-@pytest.mark.asyncio
-async def test_handle_oauth_callback_oauth_server_error():
+def test_handle_oauth_callback_session_missing(client):
     """
-    OAuth 서버와의 통신 중 오류가 발생한 경우 502 테스트
+    세션에 프론트엔드 리다이렉트 URL이 없는 경우 404 테스트
     """
+    res = client.get(_CALLBACK_URL)
+    assert res.status_code == 404
 
-    async def mock_exec(*args, **kwargs):
-        raise OAuthServerException
 
-    mock_redis_session = mock.MagicMock()
+def test_handle_oauth_callback_oauth_server_error(client):
+    """
+    OAuth 서버에서 프로필 조회에 실패한 경우 500 테스트
+    """
+    _store_frontend_redirect_url(client)
 
     with mock.patch(
-        "app.api.dep.get_redis_session",
-        return_value=mock_redis_session,
-    ), mock.patch.object(
-        HandleOAuthCallbackService, "exec", side_effect=mock_exec
+        "app.service.auth.oauth.OAuthService.fetch_raw_oauth_profile",
+        side_effect=OAuthProfileError("프로필 조회 실패"),
     ):
-        res = client.get(
-            f"/auth/oauth/{OauthProvider.GOOGLE.value}/callback?code=FYVjdmoq9RQ2UPYu_cCRhA&state=mock_state"
-        )
-        assert res.status_code == 502
+        res = client.get(_CALLBACK_URL)
+        assert res.status_code == 500
 
 
-@pytest.mark.asyncio
-async def test_handle_oauth_callback_cache_server_error():
+def test_handle_oauth_callback_cache_server_error(client):
     """
-    캐시 서버와의 통신 중 오류가 발생한 경우 502 테스트
+    캐시 서버와의 통신 중 오류가 발생한 경우 500 테스트
     """
-
-    async def mock_exec(*args, **kwargs):
-        raise CacheServerException
-
-    mock_redis_session = mock.MagicMock()
+    _store_frontend_redirect_url(client)
 
     with mock.patch(
-        "app.api.dep.get_redis_session",
-        return_value=mock_redis_session,
-    ), mock.patch.object(
-        HandleOAuthCallbackService, "exec", side_effect=mock_exec
+        "app.service.auth.oauth.OAuthService.fetch_raw_oauth_profile",
+        return_value=SimpleNamespace(name="suehyun lee", email="suehyun@example.com"),
+    ), mock.patch(
+        "app.service.cache.oauth_profile.OAuthProfileCache.set",
+        side_effect=CacheError("캐시 저장 실패"),
     ):
-        res = client.get(
-            f"/auth/oauth/{OauthProvider.GOOGLE.value}/callback?code=FYVjdmoq9RQ2UPYu_cCRhA&state=mock_state"
-        )
-        assert res.status_code == 502
+        res = client.get(_CALLBACK_URL)
+        assert res.status_code == 500
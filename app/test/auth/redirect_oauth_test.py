@@ -1,96 +1,64 @@
-import pytest
 from unittest import mock
 
-from app.test.mock_config import register_mock_env
-
-register_mock_env()
-
-from fastapi.testclient import TestClient
 from fastapi.responses import RedirectResponse
 
-from app.util.enum import OauthProvider
-from app.util.exception import (
-    OAuthServerException,
-    FieldMissingException,
-)
-from app.service.auth.redirect_oauth import RedirectOAuthService
-from app.main import app
+from app.common.enums import OauthProvider
+from app.common.exceptions import OAuthRedirectError
 
-client = TestClient(app, raise_server_exceptions=False, follow_redirects=False)
+_FRONTEND_REDIRECT_URL = "http://localhost:3000/auth/callback"
 
 
-@pytest.mark.asyncio
-async def test_redirect_oauth_success():
+def test_redirect_oauth_success(client):
     """
     성공적으로 OAuth 제공자로 리다이렉트되는 케이스 테스트
     """
     mock_redirect_url = "https://oauth-provider.com/auth"
 
-    async def mock_authorize_redirect(*args, **kwargs):
-        return RedirectResponse(url=mock_redirect_url)
-
-    mock_client = mock.MagicMock()
-    mock_client.authorize_redirect = mock_authorize_redirect
-
     with mock.patch(
-        "app.core.authlib.oauth.create_client", return_value=mock_client
-    ):
-        res = client.get(f"/auth/oauth/{OauthProvider.GOOGLE.value}")
+        "app.service.auth.oauth.OAuthService.redirect_authorization",
+        return_value=RedirectResponse(url=mock_redirect_url),
+    ) as mock_redirect_authorization:
+        res = client.get(f"/auth/oauth/{OauthProvider.GOOGLE.value}?frontend_redirect_url={_FRONTEND_REDIRECT_URL}")
         assert res.status_code == 307
+        assert res.headers["location"] == mock_redirect_url
+        assert mock_redirect_authorization.await_args.kwargs["provider"] == OauthProvider.GOOGLE
 
 
-@pytest.mark.asyncio
-async def test_redirect_oauth_invalid_provider():
+def test_redirect_oauth_invalid_provider(client):
     """
     지원하지 않는 OAuth 제공자가 전달된 경우 422 테스트
     """
-    res = client.get("/auth/oauth/invalid_provider")
+    res = client.get(f"/auth/oauth/invalid_provider?frontend_redirect_url={_FRONTEND_REDIRECT_URL}")
     assert res.status_code == 422
 
 
-@pytest.mark.asyncio
-async def test_redirect_oauth_missing_field():
+def test_redirect_oauth_missing_field(client):
     """
-    필수 파라미터가 누락된 경우 400 테스트
+    필수 파라미터(frontend_redirect_url)가 누락된 경우 422 테스트
     """
-
-    async def mock_exec(*args, **kwargs):
-        raise FieldMissingException
-
-    with mock.patch.object(
-        RedirectOAuthService, "exec", side_effect=mock_exec
-    ):
-        res = client.get(f"/auth/oauth/{OauthProvider.GOOGLE.value}")
-        assert res.status_code == 400
+    res = client.get(f"/auth/oauth/{OauthProvider.GOOGLE.value}")
+    assert res.status_code == 422
 
 
-@pytest.mark.asyncio
-async def test_redirect_oauth_server_error():
+def test_redirect_oauth_server_error(client):
     """
-    OAuth 서버와의 통신 중 오류가 발생한 경우 502 테스트
+    OAuth 리다이렉트 생성 중 오류가 발생한 경우 500 테스트
     """
-
-    async def mock_exec(*args, **kwargs):
-        raise OAuthServerException
-
-    with mock.patch.object(
-        RedirectOAuthService, "exec", side_effect=mock_exec
+    with mock.patch(
+        "app.service.auth.oauth.OAuthService.redirect_authorization",
+        side_effect=OAuthRedirectError("리다이렉트 실패"),
     ):
-        res = client.get(f"/auth/oauth/{OauthProvider.GOOGLE.value}")
-        assert res.status_code == 502
+        res = client.get(f"/auth/oauth/{OauthProvider.GOOGLE.value}?frontend_redirect_url={_FRONTEND_REDIRECT_URL}")
+        assert res.status_code == 500
 
 
-@pytest.mark.asyncio
-async def test_redirect_oauth_client_creation_failed():
+def test_redirect_oauth_unexpected_error(client):
     """
-    OAuth 클라이언트 생성에 실패한 경우 502 테스트
+    예상치 못한 오류가 발생한 경우 500 테스트
     """
-
-    def mock_create_client(*args, **kwargs):
-        raise Exception
-
     with mock.patch(
-        "app.core.authlib.oauth.create_client", side_effect=mock_create_client
+        "app.service.auth.oauth.OAuthService.redirect_authorization",
+        side_effect=Exception,
     ):
-        res = client.get(f"/auth/oauth/{OauthProvider.GOOGLE.value}")
-        assert res.status_code == 502
+        res = client.get(f"/auth/oauth/{OauthProvider.GOOGLE.value}?frontend_redirect_url={_FRONTEND_REDIRECT_URL}")
+        assert res.status_code == 500
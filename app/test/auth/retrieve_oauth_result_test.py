@@ -1,252 +1,142 @@
-import pytest
+from types import SimpleNamespace
 from unittest import mock
 
-from app.test.mock_config import register_mock_env
-
-register_mock_env()
-
-from fastapi.testclient import TestClient
+import pytest
 
-from app.util.enum import UserRole
-from app.util.exception import (
-    CacheServerException,
-    DBServerException,
-    FieldMissingException,
-    NoPermissionException,
-    DataNotFoundException,
-)
-from app.service.auth.retrieve_oauth_result import RetrieveOAuthResultService
-from app.main import app
+from app.common.enums import UserRole
+from app.common.exceptions import CacheError, UserRepositoryError
 
-client = TestClient(app, raise_server_exceptions=False, follow_redirects=False)
+_CODE = "FYVjdmoq9RQ2UPYu_cCRhA"
+_RESULT_URL = f"/auth/oauth/result?code={_CODE}"
 
 
-@pytest.mark.asyncio
-async def test_retrieve_oauth_result_existing_user_success():
+@pytest.fixture
+def mocks(client):
     """
-    이미 계정이 있는 사용자의 OAuth 결과 조회 성공 테스트 (200)
-    """
-    mock_response = {
-        "has_account": True,
-        "token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
-        "user_id": 123,
-        "roles": [UserRole.GENERAL],
-        "name": "홍길동",
-    }
-
-    async def mock_exec(*args, **kwargs):
-        return mock_response
-
-    mock_pg_session = mock.MagicMock()
-    mock_redis_session = mock.MagicMock()
-
-    with mock.patch(
-        "app.api.dep.get_pg_session",
-        return_value=mock_pg_session,
-    ), mock.patch(
-        "app.api.dep.get_redis_session",
-        return_value=mock_redis_session,
-    ), mock.patch.object(
-        RetrieveOAuthResultService, "exec", side_effect=mock_exec
-    ):
-        res = client.get("/auth/oauth/result?code=FYVjdmoq9RQ2UPYu_cCRhA")
-        assert res.status_code == 200
-        data = res.json()
-        assert data["has_account"] == True
-        assert "token" in data
-        assert "user_id" in data
-        assert "roles" in data
-        assert "name" in data
-
-
-@pytest.mark.asyncio
-async def test_retrieve_oauth_result_new_user_success():
+    저장소/캐시를 mock으로 주입한 RetrieveOAuthResultUsecase로 의존성을 교체
     """
-    계정이 없는 신규 사용자의 OAuth 결과 조회 성공 테스트 (200)
-    """
-    mock_response = {
-        "has_account": False,
-        "code": "FYVjdmoq9RQ2UPYu_cCRhA",
-        "signup_term_ids": [1, 2, 3],
-    }
-
-    async def mock_exec(*args, **kwargs):
-        return mock_response
+    from app.core.dependency import get_retrieve_oauth_result_usecase
+    from app.usecase.auth.retrieve_oauth_result import RetrieveOAuthResultUsecase
 
-    mock_pg_session = mock.MagicMock()
-    mock_redis_session = mock.MagicMock()
+    user_repository = mock.AsyncMock()
+    term_repository = mock.AsyncMock()
+    oauth_profile_cache = mock.AsyncMock()
+    oauth_profile_cache.get.return_value = SimpleNamespace(name="홍길동", email="hong@example.com", host="testclient")
 
-    with mock.patch(
-        "app.api.dep.get_pg_session",
-        return_value=mock_pg_session,
-    ), mock.patch(
-        "app.api.dep.get_redis_session",
-        return_value=mock_redis_session,
-    ), mock.patch.object(
-        RetrieveOAuthResultService, "exec", side_effect=mock_exec
-    ):
-        res = client.get("/auth/oauth/result?code=FYVjdmoq9RQ2UPYu_cCRhA")
-        assert res.status_code == 200
-        data = res.json()
-        assert data["has_account"] == False
-        assert "code" in data
-        assert "signup_term_ids" in data
+    client.app.dependency_overrides[get_retrieve_oauth_result_usecase] = lambda: RetrieveOAuthResultUsecase(
+        user_repository,
+        term_repository,
+        oauth_profile_cache,
+    )
+    yield SimpleNamespace(
+        user_repository=user_repository,
+        term_repository=term_repository,
+        oauth_profile_cache=oauth_profile_cache,
+    )
+    client.app.dependency_overrides.clear()
 
 
-@pytest.mark.asyncio
-async def test_retrieve_oauth_result_field_missing():
+def test_retrieve_oauth_result_existing_user_success(client, mocks):
     """
-    필수 파라미터가 누락된 경우 400 테스트
+    이미 계정이 있는 사용자의 OAuth 결과 조회 성공 테스트 (200)
     """
+    mocks.user_repository.find_by_email.return_value = SimpleNamespace(id=123, name="홍길동", roles=[UserRole.GENERAL])
 
-    async def mock_exec(*args, **kwargs):
-        raise FieldMissingException
+    res = client.get(_RESULT_URL)
+    assert res.status_code == 200
+    data = res.json()
+    assert data["has_account"] is True
+    assert data["token"]
+    assert data["user_id"] == 123
+    assert data["roles"] == [UserRole.GENERAL.value]
+    assert data["name"] == "홍길동"
+    mocks.oauth_profile_cache.evict.assert_awaited_once_with(_CODE)
 
-    mock_pg_session = mock.MagicMock()
-    mock_redis_session = mock.MagicMock()
 
-    with mock.patch(
-        "app.api.dep.get_pg_session",
-        return_value=mock_pg_session,
-    ), mock.patch(
-        "app.api.dep.get_redis_session",
-        return_value=mock_redis_session,
-    ), mock.patch.object(
-        RetrieveOAuthResultService, "exec", side_effect=mock_exec
-    ):
-        res = client.get("/auth/oauth/result")
-        assert res.status_code == 400
-
-
-@pytest.mark.asyncio
-async def test_retrieve_oauth_result_no_permission():
+def test_retrieve_oauth_result_new_user_success(client, mocks):
     """
-    요청 호스트와 OAuth 프로필의 호스트가 일치하지 않는 경우 403 테스트
+    계정이 없는 신규 사용자의 OAuth 결과 조회 성공 테스트 (200)
     """
+    mocks.user_repository.find_by_email.return_value = None
+    mocks.term_repository.find_active_terms.return_value = [SimpleNamespace(id=1), SimpleNamespace(id=2), SimpleNamespace(id=3)]
+    mocks.oauth_profile_cache.set.return_value = "new_code"
 
-    async def mock_exec(*args, **kwargs):
-        raise NoPermissionException
+    res = client.get(_RESULT_URL)
+    assert res.status_code == 200
+    data = res.json()
+    assert data["has_account"] is False
+    assert data["code"] == "new_code"
+    assert data["active_term_ids"] == [1, 2, 3]
+    mocks.oauth_profile_cache.evict.assert_awaited_once_with(_CODE)
 
-    mock_pg_session = mock.MagicMock()
-    mock_redis_session = mock.MagicMock()
 
-    with mock.patch(
-        "app.api.dep.get_pg_session",
-        return_value=mock_pg_session,
-    ), mock.patch(
-        "app.api.dep.get_redis_session",
-        return_value=mock_redis_session,
-    ), mock.patch.object(
-        RetrieveOAuthResultService, "exec", side_effect=mock_exec
-    ):
-        res = client.get("/auth/oauth/result?code=FYVjdmoq9RQ2UPYu_cCRhA")
-        assert res.status_code == 403
+def test_retrieve_oauth_result_field_missing(client, mocks):
+    """
+    필수 파라미터(code)가 누락된 경우 422 테스트
+    """
+    res = client.get("/auth/oauth/result")
+    assert res.status_code == 422
 
 
-@pytest.mark.asyncio
-async def test_retrieve_oauth_result_data_not_found():
+def test_retrieve_oauth_result_no_permission(client, mocks):
     """
-    OAuth 프로필을 찾을 수 없거나 필요한 약관 정보가 존재하지 않는 경우 404 테스트
+    요청한 호스트와 OAuth 프로필의 호스트가 일치하지 않는 경우 403 테스트 (코드는 유지)
     """
+    mocks.oauth_profile_cache.get.return_value = SimpleNamespace(name="홍길동", email="hong@example.com", host="other_host")
 
-    async def mock_exec(*args, **kwargs):
-        raise DataNotFoundException
+    res = client.get(_RESULT_URL)
+    assert res.status_code == 403
+    mocks.oauth_profile_cache.evict.assert_not_awaited()
 
-    mock_pg_session = mock.MagicMock()
-    mock_redis_session = mock.MagicMock()
 
-    with mock.patch(
-        "app.api.dep.get_pg_session",
-        return_value=mock_pg_session,
-    ), mock.patch(
-        "app.api.dep.get_redis_session",
-        return_value=mock_redis_session,
-    ), mock.patch.object(
-        RetrieveOAuthResultService, "exec", side_effect=mock_exec
-    ):
-        res = client.get("/auth/oauth/result?code=FYVjdmoq9RQ2UPYu_cCRhA")
-        assert res.status_code == 404
+def test_retrieve_oauth_result_data_not_found(client, mocks):
+    """
+    OAuth 프로필을 찾을 수 없는 경우 404 테스트
+    """
+    mocks.oauth_profile_cache.get.return_value = None
+
+    res = client.get(_RESULT_URL)
+    assert res.status_code == 404
 
 
-@pytest.mark.asyncio
-async def test_retrieve_oauth_result_validation_error():
+def test_retrieve_oauth_result_no_active_terms(client, mocks):
     """
-    요청 데이터의 형식이 올바르지만 비즈니스 규칙에 따른 유효성 검증에 실패한 경우 422 테스트
+    회원가입에 필요한 약관이 없는 경우 422 테스트 (코드는 유지)
     """
-    res = client.get("/auth/oauth/result?code=invalid")
+    mocks.user_repository.find_by_email.return_value = None
+    mocks.term_repository.find_active_terms.return_value = []
+
+    res = client.get(_RESULT_URL)
     assert res.status_code == 422
+    mocks.oauth_profile_cache.evict.assert_not_awaited()
 
 
-@pytest.mark.asyncio
-async def test_retrieve_oauth_result_cache_server_error():
+def test_retrieve_oauth_result_cache_server_error(client, mocks):
     """
-    Redis 캐시 서버와의 통신 중 오류가 발생한 경우 502 테스트
+    캐시 서버와의 통신 중 오류가 발생한 경우 500 테스트
     """
+    mocks.oauth_profile_cache.get.side_effect = CacheError("캐시 조회 실패")
 
-    async def mock_exec(*args, **kwargs):
-        raise CacheServerException
+    res = client.get(_RESULT_URL)
+    assert res.status_code == 500
 
-    mock_pg_session = mock.MagicMock()
-    mock_redis_session = mock.MagicMock()
 
-    with mock.patch(
-        "app.api.dep.get_pg_session",
-        return_value=mock_pg_session,
-    ), mock.patch(
-        "app.api.dep.get_redis_session",
-        return_value=mock_redis_session,
-    ), mock.patch.object(
-        RetrieveOAuthResultService, "exec", side_effect=mock_exec
-    ):
-        res = client.get("/auth/oauth/result?code=FYVjdmoq9RQ2UPYu_cCRhA")
-        assert res.status_code == 502
-
-
-@pytest.mark.asyncio
-async def test_retrieve_oauth_result_db_server_error():
+def test_retrieve_oauth_result_db_server_error(client, mocks):
     """
-    데이터베이스 서버와의 통신 중 오류가 발생한 경우 502 테스트
+    데이터베이스와의 통신 중 오류가 발생한 경우 500 테스트 (코드는 유지)
     """
+    mocks.user_repository.find_by_email.side_effect = UserRepositoryError("사용자 조회 실패")
 
-    async def mock_exec(*args, **kwargs):
-        raise DBServerException
-
-    mock_pg_session = mock.MagicMock()
-    mock_redis_session = mock.MagicMock()
+    res = client.get(_RESULT_URL)
+    assert res.status_code == 500
+    mocks.oauth_profile_cache.evict.assert_not_awaited()
 
-    with mock.patch(
-        "app.api.dep.get_pg_session",
-        return_value=mock_pg_session,
-    ), mock.patch(
-        "app.api.dep.get_redis_session",
-        return_value=mock_redis_session,
-    ), mock.patch.object(
-        RetrieveOAuthResultService, "exec", side_effect=mock_exec
-    ):
-        res = client.get("/auth/oauth/result?code=FYVjdmoq9RQ2UPYu_cCRhA")
-        assert res.status_code == 502
 
-
-@pytest.mark.asyncio
-async def test_retrieve_oauth_result_internal_server_error():
+def test_retrieve_oauth_result_internal_server_error(client, mocks):
     """
-    원인 불명의 내부 로직 오류가 발생한 경우 500 테스트
+    예상치 못한 오류가 발생한 경우 500 테스트
     """
+    mocks.user_repository.find_by_email.side_effect = Exception
 
-    async def mock_exec(*args, **kwargs):
-        raise Exception("예상치 못한 오류")
-
-    mock_pg_session = mock.MagicMock()
-    mock_redis_session = mock.MagicMock()
-
-    with mock.patch(
-        "app.api.dep.get_pg_session",
-        return_value=mock_pg_session,
-    ), mock.patch(
-        "app.api.dep.get_redis_session",
-        return_value=mock_redis_session,
-    ), mock.patch.object(
-        RetrieveOAuthResultService, "exec", side_effect=mock_exec
-    ):
-        res = client.get("/auth/oauth/result?code=FYVjdmoq9RQ2UPYu_cCRhA")
-        assert res.status_code == 500
+    res = client.get(_RESULT_URL)
+    assert res.status_code == 500
@@ -1,29 +1,24 @@
-import types
+import os
 
 
-class MockSetting:
-    app_port = 8000
-    session_middleware_secret = "test_secret_key"
-    jwt_secret = "test_jwt_secret"
-    google_oauth_client_id = "test_client_id"
-    google_oauth_secret = "test_secret"
-    google_oauth_callback_uri = "http://localhost:8000/auth/callback/google"
-    frontend_redirect_url = "http://localhost:3000"
-    redis_host = "localhost"
-    redis_port = 6379
-    pg_host = "localhost"
-    pg_port = 5432
-    pg_user = "test_user"
-    pg_pw = "test_password"
-    pg_db = "test_db"
-
-
-mock_config_module = types.ModuleType("app.core.config")
-mock_config_module.env = MockSetting()  # type: ignore
-mock_config_module.Setting = MockSetting  # type: ignore
+_MOCK_ENV = {
+    "APP_PORT": "8000",
+    "SESSION_MIDDLEWARE_SECRET": "test_secret_key",
+    "JWT_SECRET": "test_jwt_secret",
+    "GOOGLE_OAUTH_CLIENT_ID": "test_client_id",
+    "GOOGLE_OAUTH_SECRET": "test_secret",
+    "REDIS_HOST": "localhost",
+    "REDIS_PORT": "6379",
+    "PG_HOST": "localhost",
+    "PG_PORT": "5432",
+    "PG_USER": "test_user",
+    "PG_PW": "test_password",
+    "PG_DB": "test_db",
+    "PERPLEXITY_API_KEY": "test_perplexity_api_key",
+    "OPENAI_API_KEY": "test_openai_api_key",
+}
 
 
 def register_mock_env():
-    import sys
-
-    sys.modules["app.core.config"] = mock_config_module
+    # app.core.config의 Setting이 테스트용 값으로 로드되도록 환경 변수로 등록 (app 모듈 import 전에 호출)
+    os.environ.update(_MOCK_ENV)
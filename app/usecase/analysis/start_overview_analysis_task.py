@@ -178,20 +178,21 @@ class StartOverviewAnalysisTaskUsecase:
                 )
                 await project_idea_repository.save(project_idea)
 
-                ksic_hierarchy = schemas.KSICHierarchy(
-                    large=schemas.KSICItem(
+                # 본 분석 응답은 이미 검증되었으므로 저장용 스키마는 재검증 없이 구성
+                ksic_hierarchy = schemas.KSICHierarchy.model_construct(
+                    large=schemas.KSICItem.model_construct(
                         code=raw_overview_analysis.ksic_hierarchy.large.code,
                         name=raw_overview_analysis.ksic_hierarchy.large.name,
                     ),
-                    medium=schemas.KSICItem(
+                    medium=schemas.KSICItem.model_construct(
                         code=raw_overview_analysis.ksic_hierarchy.medium.code,
                         name=raw_overview_analysis.ksic_hierarchy.medium.name,
                     ),
-                    small=schemas.KSICItem(
+                    small=schemas.KSICItem.model_construct(
                         code=raw_overview_analysis.ksic_hierarchy.small.code,
                         name=raw_overview_analysis.ksic_hierarchy.small.name,
                     ),
-                    detail=schemas.KSICItem(
+                    detail=schemas.KSICItem.model_construct(
                         code=raw_overview_analysis.ksic_hierarchy.detail.code,
                         name=raw_overview_analysis.ksic_hierarchy.detail.name,
                     ),
@@ -329,6 +330,7 @@ class StartOverviewAnalysisTaskUsecase:
     ) -> OverviewAnalysis:
         assert project_idea.id is not None
 
+        # 본 분석 응답은 이미 검증되었으므로 저장용 스키마는 재검증 없이 구성
         return OverviewAnalysis(
             idea_id=project_idea.id,
             evaluation=raw_overview_analysis.one_line_review,
@@ -337,7 +339,7 @@ class StartOverviewAnalysisTaskUsecase:
             risk_score=raw_overview_analysis.scores.risk,
             opportunity_score=raw_overview_analysis.scores.opportunity,
             similar_services=[
-                schemas.SimilarService(
+                schemas.SimilarService.model_construct(
                     name=service.name,
                     description=service.description,
                     logo_url="",  # TODO: 로고 URL 처리
@@ -348,7 +350,7 @@ class StartOverviewAnalysisTaskUsecase:
                 for service in raw_overview_analysis.similar_services
             ],  # type: ignore
             support_programs=[
-                schemas.SupportProgram(
+                schemas.SupportProgram.model_construct(
                     name=program.name,
                     organizer=program.organization,
                     url="",  # TODO: URL 처리
@@ -358,41 +360,41 @@ class StartOverviewAnalysisTaskUsecase:
                 for program in raw_overview_analysis.support_programs
             ],  # type: ignore
             target_markets=[
-                schemas.TargetMarket(
+                schemas.TargetMarket.model_construct(
                     segment=target.segment,
                     reason=target.reasons,
                     value_prop=target.interest_factors,
-                    activities=schemas.TargetMarketActivity(
+                    activities=schemas.TargetMarketActivity.model_construct(
                         online=target.online_activities,
                     ),
-                    touchpoints=schemas.TargetMarketTouchpoint(
+                    touchpoints=schemas.TargetMarketTouchpoint.model_construct(
                         online=target.online_touchpoints,
                         offline=target.offline_touchpoints,
                     ),
                 ).model_dump()
                 for target in raw_overview_analysis.target_audience
             ],  # type: ignore
-            marketing_plans=schemas.MarketingPlan(
+            marketing_plans=schemas.MarketingPlan.model_construct(
                 approach=raw_overview_analysis.marketing_strategy.approach,
                 channels=raw_overview_analysis.marketing_strategy.channels,
                 messages=raw_overview_analysis.marketing_strategy.messages,
                 budget=self._parse_budget(raw_overview_analysis.marketing_strategy.budget_allocation),
                 kpis=raw_overview_analysis.marketing_strategy.kpis,
-                phase=schemas.MarketingPlanPhase(
+                phase=schemas.MarketingPlanPhase.model_construct(
                     pre=raw_overview_analysis.marketing_strategy.phased_strategy.pre_launch,
                     launch=raw_overview_analysis.marketing_strategy.phased_strategy.launch,
                     growth=raw_overview_analysis.marketing_strategy.phased_strategy.growth,
                 ),
             ).model_dump(),  # type: ignore
-            business_model=schemas.BusinessModel(
+            business_model=schemas.BusinessModel.model_construct(
                 summary=raw_overview_analysis.business_model.tagline,
-                value_proposition=schemas.BusinessModelValueProposition(
+                value_proposition=schemas.BusinessModelValueProposition.model_construct(
                     main=raw_overview_analysis.business_model.value,
                     detail=raw_overview_analysis.business_model.value_details,
                 ),
                 revenue_stream=raw_overview_analysis.business_model.revenue_structure,
                 priorities=[
-                    schemas.BusinessModelPriority(
+                    schemas.BusinessModelPriority.model_construct(
                         name=priority.name,
                         description=priority.description,
                     )
@@ -402,7 +404,7 @@ class StartOverviewAnalysisTaskUsecase:
             ).model_dump(),  # type: ignore
             opportunities=raw_overview_analysis.opportunities,
             limitations=[
-                schemas.Limitation(
+                schemas.Limitation.model_construct(
                     category=risk.category,
                     detail=risk.details,
                     impact=risk.impact,
@@ -411,7 +413,7 @@ class StartOverviewAnalysisTaskUsecase:
                 for risk in raw_overview_analysis.limitations
             ],  # type: ignore
             team_requirements=[
-                schemas.TeamRequirement(
+                schemas.TeamRequirement.model_construct(
                     priority=requirement.priority if isinstance(requirement.priority, str) else str(requirement.priority),
                     position=requirement.title,
                     skill=requirement.skills,
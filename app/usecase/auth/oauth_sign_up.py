@@ -3,10 +3,10 @@ from fastapi import Request
 from pydantic import BaseModel, ConfigDict, Field
 
 from app.common.enums import SubscriptionPlan, UserRole
+from app.common.utils import gather_or_cancel
 from app.domain.user_agreement import UserAgreement
 from app.domain.user import User
 from app.repository.term import TermRepository
-from app.repository.user_agreement import UserAgreementRepository
 from app.repository.user import UserRepository
 from app.service.auth.jwt import JWTService, Payload
 from app.service.cache.oauth_profile import OAuthProfileCache
@@ -82,12 +82,10 @@ class OAuthSignUpUsecase:
         self,
         user_repository: UserRepository,
         term_repository: TermRepository,
-        user_agreement_repository: UserAgreementRepository,
         oauth_profile_cache: OAuthProfileCache,
     ) -> None:
         self._user_repository = user_repository
         self._term_repository = term_repository
-        self._user_agreement_repository = user_agreement_repository
         self._oauth_profile_cache = oauth_profile_cache
 
     async def execute(
@@ -101,39 +99,41 @@ class OAuthSignUpUsecase:
             if not host:
                 raise UnauthorizedException("클라이언트 호스트 정보를 조회할 수 없습니다")
 
-            oauth_profile = await self._oauth_profile_cache.get(dto.code)
+            # OAuth 프로필(Redis)과 활성 약관(DB)은 서로 독립적이므로 동시에 조회
+            oauth_profile, active_terms = await gather_or_cancel(
+                self._oauth_profile_cache.get(dto.code),
+                self._term_repository.find_active_terms(),
+            )
             if not oauth_profile:
                 raise NotFoundException("OAuth 프로필을 찾을 수 없습니다")
 
             if oauth_profile.host != host:
                 raise HostMismatchException("요청한 호스트와 OAuth 프로필의 호스트가 일치하지 않습니다")
 
-            # 2. 활성 약관 조회 및 동의 내역 검증
-            active_terms = await self._term_repository.find_active_terms()
+            # 2. 약관 동의 내역 검증
             await self._validate_term_agreements(dto.term_agreements, active_terms)
 
-            # 3. 신규 사용자 생성 및 저장
+            # 3. 신규 사용자 및 약관 동의 내역 저장
             user = User(
                 name=oauth_profile.name,
                 email=oauth_profile.email,
                 roles=[UserRole.GENERAL],
                 subscription_plan=SubscriptionPlan.FREE,
             )
-            await self._user_repository.save(user)
-
-            # 4. 약관 동의 내역 저장
+            await self._user_repository.save_with_term_agreements(
+                user,
+                lambda user_id: [
+                    UserAgreement(
+                        user_id=user_id,
+                        term_id=agreement.term_id,
+                        is_agreed=agreement.is_agreed,
+                    )
+                    for agreement in dto.term_agreements
+                ],
+            )
             user_id = cast(int, user.id)
-            submitted_term_agreements = [
-                UserAgreement(
-                    user_id=user_id,
-                    term_id=agreement.term_id,
-                    is_agreed=agreement.is_agreed,
-                )
-                for agreement in dto.term_agreements
-            ]
-            await self._user_agreement_repository.save_batch(submitted_term_agreements)
 
-            # 5. JWT 토큰 생성
+            # 4. JWT 토큰 생성
             token = JWTService.encode(
                 payload=Payload(
                     id=user_id,
@@ -142,10 +142,10 @@ class OAuthSignUpUsecase:
                 )
             )
 
-            # 6. OAuth 프로필 캐시 정리
+            # 5. OAuth 프로필 캐시 정리
             await self._oauth_profile_cache.evict(dto.code)
 
-            # 7. 회원가입 완료 응답 반환
+            # 6. 회원가입 완료 응답 반환
             return OAuthSignUpUsecaseResponse(
                 token=token,
                 user=_User(
@@ -164,18 +164,22 @@ class OAuthSignUpUsecase:
 
     async def _validate_term_agreements(self, term_agreements, active_terms):
         """약관 동의 내역 유효성 검증"""
-        submitted_term_ids = {agreement.term_id for agreement in term_agreements}
-        active_term_ids = {term.id for term in active_terms}
+        term_agreement_map = {agreement.term_id: agreement.is_agreed for agreement in term_agreements}
+
+        # 활성 약관 ID와 필수 약관을 한 번의 순회로 수집
+        active_term_ids = set()
+        required_terms = []
+        for term in active_terms:
+            active_term_ids.add(term.id)
+            if term.is_required:
+                required_terms.append(term)
 
         # 유효하지 않은 약관 ID 확인
-        invalid_term_ids = submitted_term_ids - active_term_ids
+        invalid_term_ids = term_agreement_map.keys() - active_term_ids
         if invalid_term_ids:
             raise InvalidTermException(f"유효하지 않은 약관 ID가 포함되어 있습니다: {list(invalid_term_ids)}")
 
         # 필수 약관 동의 여부 확인
-        required_terms = [term for term in active_terms if term.is_required]
-        term_agreement_map = {agreement.term_id: agreement.is_agreed for agreement in term_agreements}
-
         for required_term in required_terms:
             if required_term.id not in term_agreement_map:
                 raise RequiredTermNotAgreedException(f"필수 약관 '{required_term.title}'에 대한 동의가 누락되었습니다")
@@ -183,8 +187,6 @@ class OAuthSignUpUsecase:
                 raise RequiredTermNotAgreedException(f"필수 약관 '{required_term.title}'에 동의해야 합니다")
 
         # 모든 활성 약관 제출 여부 확인
-        missing_term_ids = active_term_ids - submitted_term_ids
-        if missing_term_ids:
-            missing_terms = [term for term in active_terms if term.id in missing_term_ids]
-            missing_term_titles = [term.title for term in missing_terms]
+        missing_term_titles = [term.title for term in active_terms if term.id not in term_agreement_map]
+        if missing_term_titles:
             raise MissingTermException(f"누락된 약관이 있습니다: {missing_term_titles}")
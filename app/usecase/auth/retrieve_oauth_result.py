@@ -4,6 +4,7 @@ from fastapi import Query, Request
 from pydantic import BaseModel, ConfigDict, Field
 
 from app.common.enums import UserRole
+from app.common.utils import gather_or_cancel
 from app.domain.user import User
 from app.repository.term import TermRepository
 from app.repository.user import UserRepository
@@ -73,6 +74,7 @@ class RetrieveOAuthResultUsecase:
             if not host:
                 raise UnauthorizedException("클라이언트 호스트 정보를 조회할 수 없습니다")
 
+            # 실패 시 같은 코드로 다시 요청할 수 있도록 임시 코드는 처리가 성공한 뒤에 삭제
             oauth_profile = await self._oauth_profile_cache.get(dto.code)
             if not oauth_profile:
                 raise NotFoundException("OAuth 프로필을 찾을 수 없습니다")
@@ -128,14 +130,14 @@ class RetrieveOAuthResultUsecase:
         dto: RetrieveOAuthResultUsecaseDTO,
         oauth_profile: OAuthProfile,
     ) -> RetrieveOAuthResultUsecaseResponse:
-        # OAuth 프로필을 새로운 키로 재저장
-        key = await self._oauth_profile_cache.set(
-            data=oauth_profile,
-            expire_delta=self._UNTIL_TERM_AGREEMENT_EXPIRE_DELTA,
+        # OAuth 프로필 재저장(Redis)과 활성 약관 목록 조회(DB)는 서로 독립적이므로 동시에 실행
+        key, active_terms = await gather_or_cancel(
+            self._oauth_profile_cache.set(
+                data=oauth_profile,
+                expire_delta=self._UNTIL_TERM_AGREEMENT_EXPIRE_DELTA,
+            ),
+            self._term_repository.find_active_terms(),
         )
-
-        # 활성 약관 목록 조회
-        active_terms = await self._term_repository.find_active_terms()
         if len(active_terms) == 0:
             raise BusinessLogicException("회원가입에 필요한 약관이 존재하지 않습니다")
 
@@ -23,6 +23,9 @@ class RetrieveTermsUsecaseDTO(BaseModel):
 
 
 class _Term(BaseModel):
+    # ORM 객체에서 바로 검증하여 dict 변환을 거치지 않음
+    model_config = ConfigDict(from_attributes=True)
+
     id: int = Field(description="약관 ID")
     title: str = Field(description="약관 제목")
     type: TermType = Field(description="약관 타입")
@@ -90,11 +93,12 @@ class RetrieveTermsUsecase:
                 raise NotFoundException("요청된 약관을 찾을 수 없습니다")
 
             # 2. 조회 결과 분석 및 누락된 ID 확인
+            # 요청 순서를 유지하면서 중복 없이 누락된 ID만 수집
             found_term_ids = {term.id for term in terms}
-            missing_term_ids = list(set(dto.ids) - found_term_ids) or None
+            missing_term_ids = [term_id for term_id in dict.fromkeys(dto.ids) if term_id not in found_term_ids] or None
 
             # 3. 약관 정보를 응답 형태로 변환하여 반환
-            term_responses = [_Term.model_validate(term.model_dump()) for term in terms]
+            term_responses = [_Term.model_validate(term) for term in terms]
             return RetrieveTermsUsecaseResponse(
                 terms=term_responses,
                 missing_ids=missing_term_ids,